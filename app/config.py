@@ -1,8 +1,9 @@
 """Configuration settings for Admin Service"""
 
 import os
+from dataclasses import dataclass
 from functools import lru_cache
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -40,16 +41,51 @@ class Settings(BaseSettings):
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 300
     RATE_LIMIT_PER_HOUR: int = 10000
+
+    # Audit log batching
+    AUDIT_BATCH_SIZE: int = 100
+    AUDIT_FLUSH_MS: int = 50
+
+    # Session validation caching
+    SESSION_CACHE_TTL: int = 5  # seconds a validated session stays hot
+    SESSION_NEG_CACHE_TTL: int = 30  # seconds an invalid token stays blocked
+    SESSION_ACTIVITY_FLUSH_SECONDS: int = 5
+
+    # Concurrency cap for heavy user handlers (hashing, multi-RTT)
+    MAX_INFLIGHT_PER_HANDLER: int = 64
+
+    # Organization stats caching
+    STATS_CACHE_TTL: int = 30  # seconds
+    STATS_SOFT_DEADLINE: float = 1.5  # seconds to wait for stats replies
     
     # Logging
     LOG_LEVEL: str = "INFO"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """Get cached settings instance"""
-    return Settings()
\ No newline at end of file
+    return Settings()
+
+
+# Module-level instance so import-time users skip the cached call entirely
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Hot-path settings snapshot; slot reads skip pydantic's machinery"""
+    default_page_size: int
+    max_page_size: int
+    audit_batch_size: int
+    audit_flush_ms: int
+
+
+RUNTIME = RuntimeConfig(
+    default_page_size=settings.DEFAULT_PAGE_SIZE,
+    max_page_size=settings.MAX_PAGE_SIZE,
+    audit_batch_size=settings.AUDIT_BATCH_SIZE,
+    audit_flush_ms=settings.AUDIT_FLUSH_MS
+)
\ No newline at end of file
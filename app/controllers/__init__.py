@@ -1,7 +1,22 @@
 """Admin service controllers"""
 
-from .admin_controller import AdminController
-from .organization_controller import OrganizationController
-from .user_controller import UserController
+import importlib
 
-__all__ = ['AdminController', 'OrganizationController', 'UserController']
\ No newline at end of file
+# Controllers load lazily (PEP 562) so importing the package does not
+# pull in app.models / app.services for callers that need only one
+_LAZY = {
+    'AdminController': '.admin_controller',
+    'OrganizationController': '.organization_controller',
+    'UserController': '.user_controller'
+}
+
+__all__ = ['AdminController', 'OrganizationController', 'UserController']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,78 +1,168 @@
 """Admin management controller"""
 
-import json
+import asyncio
+import functools
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
+import orjson
+from pydantic import TypeAdapter
+
+from app.config import RUNTIME
 from app.models import AdminUser, AdminRole, AuditLog
 from app.services import AuthService
 
 logger = logging.getLogger(__name__)
 
+# Built once so the schema is not re-resolved per request
+_ADMIN_ADAPTER = TypeAdapter(AdminUser)
+
+
+# Status headers let fast-path consumers branch on success without
+# parsing the body; the JSON envelope is kept for existing clients
+_HDR_OK = {'Status': 'ok'}
+
+
+def _err_headers(code: str) -> Dict[str, str]:
+    """Headers for an error response"""
+    return {'Status': 'err', 'Error-Code': code}
+
+
+_HDR_FORBIDDEN = _err_headers('FORBIDDEN')
+_HDR_ALREADY_EXISTS = _err_headers('ALREADY_EXISTS')
+_HDR_INVALID_REQUEST = _err_headers('INVALID_REQUEST')
+_HDR_INTERNAL_ERROR = _err_headers('INTERNAL_ERROR')
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as a naive ISO string (stored document format)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _ok_bytes(data: Any = None) -> bytes:
+    """Serialize a success envelope to bytes"""
+    return orjson.dumps({'success': True, 'data': data},
+                        option=orjson.OPT_NAIVE_UTC)
+
+
+def _error_bytes(code: str, message: str) -> bytes:
+    """Serialize an error envelope to bytes"""
+    return orjson.dumps({
+        'success': False,
+        'error': {
+            'code': code,
+            'message': message
+        }
+    })
+
+
+# Canned error responses, serialized once at import time
+_ERR_FORBIDDEN_CREATE = _error_bytes('FORBIDDEN', 'Only super admins can create admin users')
+_ERR_FORBIDDEN_UPDATE = _error_bytes('FORBIDDEN', 'Insufficient permissions')
+_ERR_FORBIDDEN_DELETE = _error_bytes('FORBIDDEN', 'Only super admins can delete admin users')
+_ERR_FORBIDDEN_LIST = _error_bytes('FORBIDDEN', 'Only super admins can list admin users')
+_ERR_ALREADY_EXISTS = _error_bytes('ALREADY_EXISTS', 'Admin with this email already exists')
+_ERR_SELF_DELETE = _error_bytes('INVALID_REQUEST', 'Cannot delete your own admin account')
+
+
+def _require_super_admin(error: bytes):
+    """Gate a handler on the requester being a super admin"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, data, msg):
+            if not data.get('requester', {}).get('is_super_admin'):
+                await self.nats.respond(msg, error, _HDR_FORBIDDEN)
+                return
+            await fn(self, data, msg)
+        return wrapper
+    return decorator
+
 
 class AdminController:
     """Handle admin user operations"""
-    
+
     def __init__(self, nats_service, auth_service: AuthService):
         self.nats = nats_service
         self.auth = auth_service
-        
+        # Bounded so a stalled flusher degrades to dropped audit rows
+        # instead of unbounded memory growth
+        self._audit_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=RUNTIME.audit_batch_size * 100
+        )
+        self._audit_task: Optional[asyncio.Task] = None
+        self._dispatch = {
+            'admin.create': self.handle_create_admin,
+            'admin.update': self.handle_update_admin,
+            'admin.delete': self.handle_delete_admin,
+            'admin.list': self.handle_list_admins,
+            'admin.get_by_email': self.handle_get_admin_by_email
+        }
+
+    async def _reply(self, msg, payload: Dict[str, Any]) -> None:
+        """Respond with an envelope payload plus the matching Status header"""
+        if payload.get('success'):
+            headers = _HDR_OK
+        else:
+            headers = _err_headers(payload.get('error', {}).get('code', 'ERROR'))
+        await self.nats.respond(
+            msg, orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC), headers
+        )
+
+    @_require_super_admin(_ERR_FORBIDDEN_CREATE)
     async def handle_create_admin(self, data: Dict[str, Any], msg) -> None:
         """Handle create admin request"""
         try:
-            # Validate requester permissions
             requester = data.get('requester', {})
-            if not requester.get('is_super_admin'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Only super admins can create admin users'
-                    }
-                }).encode())
-                return
-                
+            req_id = requester.get('admin_id')
+
             # Create admin user
             admin_data = data.get('admin', {})
-            
-            # Hash password
+
+            # Hash password off the event loop; bcrypt costs tens of ms of
+            # pure CPU and would otherwise stall all other handlers
             password = admin_data.pop('password', None)
             if password:
-                admin_data['password_hash'] = self.auth.hash_password(password)
-                
-            # Create admin object
-            admin = AdminUser(**admin_data)
-            admin.created_by = requester.get('admin_id')
-            
-            # Check if email already exists
-            existing = await self.nats.request("db.find_one", {
+                admin_data['password_hash'] = await asyncio.to_thread(
+                    self.auth.hash_password, password
+                )
+
+            # Create admin object via the cached adapter
+            admin = _ADMIN_ADAPTER.validate_python(admin_data)
+            admin.created_by = req_id
+
+            # Save to database; the unique index on email replaces the
+            # old find-then-create round-trip and closes its race window
+            response = await self.nats.request("db.create_unique", {
                 'collection': 'admin_users',
-                'filter': {'email': admin.email}
+                'document': _ADMIN_ADAPTER.dump_python(
+                    admin, mode='json', exclude={'password_hash'}
+                ),
+                'unique_fields': ['email']
             })
-            
-            if existing.get('data'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'ALREADY_EXISTS',
-                        'message': 'Admin with this email already exists'
-                    }
-                }).encode())
+
+            if not response.get('success') and \
+                    response.get('error', {}).get('code') in ('DUPLICATE_KEY', 'E11000'):
+                await self.nats.respond(msg, _ERR_ALREADY_EXISTS, _HDR_ALREADY_EXISTS)
                 return
-                
-            # Save to database
-            response = await self.nats.request("db.create", {
-                'collection': 'admin_users',
-                'document': admin.dict(exclude={'password_hash'})
-            })
-            
+
             if response.get('success'):
                 created_admin = response.get('data')
-                
+
+                # Admit the new address to the login email filter.
+                # The local call covers this replica; the broadcast
+                # event (no queue group) reaches every other replica's
+                # filter, which would otherwise hard-reject the new
+                # admin's logins until restart.
+                self.auth.note_admin_email(admin.email)
+                await self.nats.publish("admin.email_admitted", {
+                    'admin_id': created_admin.get('id'),
+                    'email': admin.email
+                })
+
                 # Audit log
                 await self._create_audit_log(
-                    admin_id=requester.get('admin_id'),
+                    admin_id=req_id,
                     action='admin.create',
                     resource_type='admin_user',
                     resource_id=created_admin.get('id'),
@@ -80,258 +170,283 @@ class AdminController:
                     success=True,
                     request_data=data
                 )
-                
-                await msg.respond(json.dumps({
-                    'success': True,
-                    'data': created_admin
-                }).encode())
+
+                await self.nats.respond(msg, _ok_bytes(created_admin), _HDR_OK)
             else:
-                await msg.respond(json.dumps(response).encode())
-                
+                await self._reply(msg, response)
+
         except Exception as e:
             logger.error(f"Error creating admin: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
+            await self.nats.respond(msg, _error_bytes('INTERNAL_ERROR', str(e)),
+                                    _HDR_INTERNAL_ERROR)
+
     async def handle_update_admin(self, data: Dict[str, Any], msg) -> None:
         """Handle update admin request"""
         try:
             admin_id = data.get('admin_id')
             updates = data.get('updates', {})
             requester = data.get('requester', {})
-            
+            req_id = requester.get('admin_id')
+
             # Check permissions
-            if not requester.get('is_super_admin') and requester.get('admin_id') != admin_id:
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions'
-                    }
-                }).encode())
+            if not requester.get('is_super_admin') and req_id != admin_id:
+                await self.nats.respond(msg, _ERR_FORBIDDEN_UPDATE, _HDR_FORBIDDEN)
                 return
-                
-            # Get current admin
-            current = await self.nats.request("db.find_by_id", {
+
+            # Fetch the current admin (needed for the audit log) while any
+            # password hashes in a worker thread, instead of sequentially
+            current_task = asyncio.create_task(self.nats.request("db.find_by_id", {
                 'collection': 'admin_users',
                 'id': admin_id
-            })
-            
+            }))
+
+            if 'password' in updates:
+                password = updates.pop('password')
+                updates['password_hash'] = await asyncio.to_thread(
+                    self.auth.hash_password, password
+                )
+
+            current = await current_task
             if not current.get('success'):
-                await msg.respond(json.dumps(current).encode())
+                await self._reply(msg, current)
                 return
-                
+
             old_values = current.get('data')
-            
-            # Handle password update
-            if 'password' in updates:
-                password = updates.pop('password')
-                updates['password_hash'] = self.auth.hash_password(password)
-                
+
             # Update admin
-            updates['updated_at'] = datetime.utcnow().isoformat()
-            updates['updated_by'] = requester.get('admin_id')
-            
+            updates['updated_at'] = _utc_now_iso()
+            updates['updated_by'] = req_id
+
             response = await self.nats.request("db.update", {
                 'collection': 'admin_users',
                 'id': admin_id,
                 'updates': updates
             })
-            
+
             if response.get('success'):
-                # Audit log
-                await self._create_audit_log(
-                    admin_id=requester.get('admin_id'),
-                    action='admin.update',
-                    resource_type='admin_user',
-                    resource_id=admin_id,
-                    old_values=old_values,
-                    new_values=updates,
-                    success=True,
-                    request_data=data
+                # An email change or reactivation must reach the login
+                # email filter on every replica, same as admin creation
+                if 'email' in updates or updates.get('is_active'):
+                    email = updates.get('email') or (old_values or {}).get('email')
+                    if email:
+                        self.auth.note_admin_email(email)
+                        await self.nats.publish("admin.email_admitted", {
+                            'admin_id': admin_id,
+                            'email': email
+                        })
+
+                # Audit log does not gate the reply; send both concurrently
+                await asyncio.gather(
+                    self._create_audit_log(
+                        admin_id=req_id,
+                        action='admin.update',
+                        resource_type='admin_user',
+                        resource_id=admin_id,
+                        old_values=old_values,
+                        new_values=updates,
+                        success=True,
+                        request_data=data
+                    ),
+                    self._reply(msg, response),
+                    return_exceptions=True
                 )
-                
-            await msg.respond(json.dumps(response).encode())
-            
+            else:
+                await self._reply(msg, response)
+
         except Exception as e:
             logger.error(f"Error updating admin: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
+            await self.nats.respond(msg, _error_bytes('INTERNAL_ERROR', str(e)),
+                                    _HDR_INTERNAL_ERROR)
+
+    @_require_super_admin(_ERR_FORBIDDEN_DELETE)
     async def handle_delete_admin(self, data: Dict[str, Any], msg) -> None:
         """Handle delete admin request"""
         try:
             admin_id = data.get('admin_id')
             requester = data.get('requester', {})
-            
-            # Only super admins can delete
-            if not requester.get('is_super_admin'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Only super admins can delete admin users'
-                    }
-                }).encode())
-                return
-                
+            req_id = requester.get('admin_id')
+
             # Prevent self-deletion
-            if requester.get('admin_id') == admin_id:
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'INVALID_REQUEST',
-                        'message': 'Cannot delete your own admin account'
-                    }
-                }).encode())
+            if req_id == admin_id:
+                await self.nats.respond(msg, _ERR_SELF_DELETE, _HDR_INVALID_REQUEST)
                 return
-                
+
             # Soft delete
             response = await self.nats.request("db.update", {
                 'collection': 'admin_users',
                 'id': admin_id,
                 'updates': {
                     'is_active': False,
-                    'deleted_at': datetime.utcnow().isoformat(),
-                    'deleted_by': requester.get('admin_id')
+                    'deleted_at': _utc_now_iso(),
+                    'deleted_by': req_id
                 }
             })
-            
+
             if response.get('success'):
-                # Invalidate all sessions
-                await self.nats.publish("admin.invalidate_all_sessions", {
-                    'admin_id': admin_id
-                })
-                
-                # Audit log
-                await self._create_audit_log(
-                    admin_id=requester.get('admin_id'),
-                    action='admin.delete',
-                    resource_type='admin_user',
-                    resource_id=admin_id,
-                    success=True,
-                    request_data=data
+                # Session invalidation and the audit log are independent;
+                # overlap them instead of awaiting sequentially
+                results = await asyncio.gather(
+                    self.nats.publish("admin.invalidate_all_sessions", {
+                        'admin_id': admin_id
+                    }),
+                    self._create_audit_log(
+                        admin_id=req_id,
+                        action='admin.delete',
+                        resource_type='admin_user',
+                        resource_id=admin_id,
+                        success=True,
+                        request_data=data
+                    ),
+                    return_exceptions=True
                 )
-                
-            await msg.respond(json.dumps(response).encode())
-            
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error(f"Error in delete admin side effect: {result}")
+
+            await self._reply(msg, response)
+
         except Exception as e:
             logger.error(f"Error deleting admin: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
+            await self.nats.respond(msg, _error_bytes('INTERNAL_ERROR', str(e)),
+                                    _HDR_INTERNAL_ERROR)
+
+    @_require_super_admin(_ERR_FORBIDDEN_LIST)
     async def handle_list_admins(self, data: Dict[str, Any], msg) -> None:
         """Handle list admins request"""
         try:
-            requester = data.get('requester', {})
-            
-            # Check permissions
-            if not requester.get('is_super_admin'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Only super admins can list admin users'
-                    }
-                }).encode())
-                return
-                
             # Build filter
             filter_params = {'is_active': True}
-            
+
             if data.get('role'):
                 filter_params['role'] = data['role']
-                
-            # List admins
+
+            # Clamp page size so one request cannot pull the whole collection
+            limit = min(int(data.get('limit', RUNTIME.default_page_size)),
+                        RUNTIME.max_page_size)
+
+            # List admins, projecting only the fields the listing UI shows
             response = await self.nats.request("db.find", {
                 'collection': 'admin_users',
                 'filter': filter_params,
                 'projection': {
-                    'password_hash': 0,
-                    'mfa_secret': 0
+                    'id': 1,
+                    'email': 1,
+                    'first_name': 1,
+                    'last_name': 1,
+                    'role': 1,
+                    'is_active': 1,
+                    'is_super_admin': 1,
+                    'created_at': 1,
+                    'last_login': 1
                 },
                 'sort': {'created_at': -1},
-                'limit': data.get('limit', 50),
+                'limit': limit,
                 'skip': data.get('skip', 0)
             })
-            
-            await msg.respond(json.dumps(response).encode())
-            
+
+            await self._reply(msg, response)
+
         except Exception as e:
             logger.error(f"Error listing admins: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
+            await self.nats.respond(msg, _error_bytes('INTERNAL_ERROR', str(e)),
+                                    _HDR_INTERNAL_ERROR)
+
     async def handle_get_admin_by_email(self, data: Dict[str, Any], msg) -> None:
         """Handle get admin by email request"""
         try:
             email = data.get('email')
-            
+
             response = await self.nats.request("db.find_one", {
                 'collection': 'admin_users',
                 'filter': {'email': email, 'is_active': True}
             })
-            
-            await msg.respond(json.dumps(response).encode())
-            
+
+            await self._reply(msg, response)
+
         except Exception as e:
             logger.error(f"Error getting admin by email: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
-    async def _create_audit_log(self, **kwargs):
-        """Create audit log entry"""
+            await self.nats.respond(msg, _error_bytes('INTERNAL_ERROR', str(e)),
+                                    _HDR_INTERNAL_ERROR)
+
+    async def _create_audit_log(self, *, admin_id, action, resource_type,
+                                resource_id=None, org_id=None, old_values=None,
+                                new_values=None, success=True, error_message=None,
+                                request_data=None):
+        """Queue an audit log entry for the next batch flush"""
         try:
-            audit_log = AuditLog(
-                admin_id=kwargs.get('admin_id'),
-                action=kwargs.get('action'),
-                resource_type=kwargs.get('resource_type'),
-                resource_id=kwargs.get('resource_id'),
-                org_id=kwargs.get('org_id'),
-                old_values=kwargs.get('old_values'),
-                new_values=kwargs.get('new_values'),
-                success=kwargs.get('success', True),
-                error_message=kwargs.get('error_message'),
-                ip_address=kwargs.get('request_data', {}).get('ip_address', 'unknown'),
-                user_agent=kwargs.get('request_data', {}).get('user_agent', 'unknown'),
-                request_method=kwargs.get('request_data', {}).get('method', 'NATS'),
-                request_path=kwargs.get('request_data', {}).get('path', kwargs.get('action'))
-            )
-            
-            await self.nats.publish("audit.create", audit_log.dict())
-            
+            request_data = request_data or {}
+            # Plain dict, shaped like AuditLog.model_dump(mode='json').
+            # Every field is produced in-process, so running 11 pydantic
+            # validators per event buys nothing on this hot path;
+            # AuditLog stays as the schema for external consumers.
+            try:
+                self._audit_queue.put_nowait({
+                    'id': None,
+                    'admin_id': admin_id,
+                    'action': action,
+                    'resource_type': resource_type,
+                    'resource_id': resource_id,
+                    'org_id': org_id,
+                    'old_values': old_values,
+                    'new_values': new_values,
+                    'success': success,
+                    'error_message': error_message,
+                    'ip_address': request_data.get('ip_address', 'unknown'),
+                    'user_agent': request_data.get('user_agent', 'unknown'),
+                    'request_method': request_data.get('method', 'NATS'),
+                    'request_path': request_data.get('path', action),
+                    'created_at': datetime.utcnow().isoformat()
+                })
+            except asyncio.QueueFull:
+                logger.warning("Audit queue full; dropping entry for %s", action)
+
         except Exception as e:
             logger.error(f"Error creating audit log: {e}")
-            
+
+    async def _flush_audit_batch(self, batch):
+        """Publish a batch of audit log entries"""
+        try:
+            await self.nats.publish("audit.create_batch", {'logs': batch})
+        except Exception as e:
+            logger.error(f"Error publishing audit batch: {e}")
+
+    async def _audit_flusher(self):
+        """Drain the audit queue, coalescing entries into batch publishes"""
+        batch_size = RUNTIME.audit_batch_size
+        flush_window = RUNTIME.audit_flush_ms / 1000.0
+
+        while True:
+            batch = [await self._audit_queue.get()]
+
+            # Coalesce whatever arrives within the flush window
+            deadline = asyncio.get_event_loop().time() + flush_window
+            while len(batch) < batch_size:
+                remaining = deadline - asyncio.get_event_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._audit_queue.get(), timeout=remaining
+                    ))
+                except asyncio.TimeoutError:
+                    break
+                except asyncio.CancelledError:
+                    await self._flush_audit_batch(batch)
+                    raise
+
+            await self._flush_audit_batch(batch)
+
+    async def _route(self, data: Dict[str, Any], msg) -> None:
+        """Dispatch an admin.> message to its handler"""
+        handler = self._dispatch.get(msg.subject)
+        if handler:
+            await handler(data, msg)
+
     async def setup_subscriptions(self):
         """Setup NATS subscriptions"""
-        await self.nats.subscribe("admin.create", self.handle_create_admin)
-        await self.nats.subscribe("admin.update", self.handle_update_admin)
-        await self.nats.subscribe("admin.delete", self.handle_delete_admin)
-        await self.nats.subscribe("admin.list", self.handle_list_admins)
-        await self.nats.subscribe("admin.get_by_email", self.handle_get_admin_by_email)
\ No newline at end of file
+        if self._audit_task is None:
+            self._audit_task = asyncio.create_task(self._audit_flusher())
+        # One wildcard subscription instead of five; subjects owned by
+        # other services (e.g. admin.invalidate_all_sessions) fall through
+        # Queue group so admin commands load-balance across replicas
+        await self.nats.subscribe("admin.>", self._route, queue='htpi-admin-core')
@@ -1,14 +1,74 @@
 """Organization management controller"""
 
 import asyncio
-import json
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
-from app.models import Organization, OrganizationStats, OrganizationStatus, BillingPlan
+import orjson
+
+from app.config import get_settings
+from app.models import Organization, OrganizationStatus, BillingPlan
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a response payload with orjson"""
+    return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+
+
+async def _respond_large(msg, payload: Dict[str, Any]) -> None:
+    """Respond with a large payload, encoding it off the event loop
+
+    Worth the executor hand-off only for list/stats-sized payloads;
+    small error envelopes stay on the synchronous path.
+    """
+    data = await asyncio.get_running_loop().run_in_executor(None, _dumps, payload)
+    await msg.respond(data)
+
+
+def _error_bytes(code: str, message: str) -> bytes:
+    """Serialize an error envelope to bytes"""
+    return orjson.dumps({
+        'success': False,
+        'error': {
+            'code': code,
+            'message': message
+        }
+    })
+
+
+# NATS subjects used by this controller, bound once at import.
+# nats-py requires str subjects, so these stay strings rather than the
+# pre-encoded bytes suggested in the tuning notes.
+_SUBJ_DB_CREATE_UNIQUE = "db.create_unique"
+_SUBJ_DB_UPDATE = "db.update"
+_SUBJ_DB_FIND = "db.find"
+_SUBJ_STATS_COLLECT = "stats.collect"
+_SUBJ_USER_CREATE_OWNER = "user.create_owner"
+_SUBJ_USER_SUSPEND_ALL = "user.suspend_all"
+_SUBJ_ORG_CREATED = "organization.created"
+_SUBJ_ORG_UPDATED = "organization.updated"
+_SUBJ_ORG_SUSPENDED = "organization.suspended"
+
+
+# Canned error responses, serialized once at import time
+_ERR_FORBIDDEN_CREATE = _error_bytes('FORBIDDEN', 'Insufficient permissions to create organization')
+_ERR_FORBIDDEN_UPDATE = _error_bytes('FORBIDDEN', 'Insufficient permissions to update organization')
+_ERR_FORBIDDEN_SUSPEND = _error_bytes('FORBIDDEN', 'Insufficient permissions to suspend organization')
+_ERR_FORBIDDEN_LIST = _error_bytes('FORBIDDEN', 'Insufficient permissions to list organizations')
+_ERR_FORBIDDEN_STATS = _error_bytes('FORBIDDEN', 'Insufficient permissions')
+_ERR_NO_ORG_ACCESS = _error_bytes('FORBIDDEN', 'Cannot access this organization')
+_ERR_NAME_EXISTS = _error_bytes('ALREADY_EXISTS', 'Organization with this name already exists')
+
+# Reply for requesters with no accessible organizations
+_EMPTY_ORG_LIST = orjson.dumps({'success': True, 'data': []})
+
+# Constant part of the suspend update document
+_SUSPEND_BASE = {'status': OrganizationStatus.SUSPENDED}
 
 
 class OrganizationController:
@@ -16,6 +76,10 @@ class OrganizationController:
     
     def __init__(self, nats_service):
         self.nats = nats_service
+        # Short-TTL response cache for the stats roll-up, with per-key
+        # locks so concurrent misses coalesce into one downstream fan-out
+        self._stats_cache: Dict[tuple, tuple] = {}
+        self._stats_locks: Dict[tuple, asyncio.Lock] = {}
         
     async def handle_create_organization(self, data: Dict[str, Any], msg) -> None:
         """Handle create organization request"""
@@ -24,13 +88,7 @@ class OrganizationController:
             
             # Check permissions
             if not self._has_permission(requester, 'org:create'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to create organization'
-                    }
-                }).encode())
+                await msg.respond(_ERR_FORBIDDEN_CREATE)
                 return
                 
             # Create organization
@@ -45,59 +103,49 @@ class OrganizationController:
             org = Organization(**org_data)
             org.created_by = requester.get('admin_id')
             
-            # Check if organization name already exists
-            existing = await self.nats.request("db.find_one", {
+            # Save to database; the unique index on name replaces the old
+            # find-then-create round-trip and closes its race window
+            response = await self.nats.request(_SUBJ_DB_CREATE_UNIQUE, {
                 'collection': 'organizations',
-                'filter': {'name': org.name}
+                'document': org.dict(),
+                'unique_fields': ['name']
             })
-            
-            if existing.get('data'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'ALREADY_EXISTS',
-                        'message': 'Organization with this name already exists'
-                    }
-                }).encode())
+
+            if not response.get('success') and \
+                    response.get('error', {}).get('code') in ('DUPLICATE_KEY', 'E11000'):
+                await msg.respond(_ERR_NAME_EXISTS)
                 return
-                
-            # Save to database
-            response = await self.nats.request("db.create", {
-                'collection': 'organizations',
-                'document': org.dict()
-            })
-            
+
             if response.get('success'):
                 created_org = response.get('data')
                 
-                # Create default admin user for organization
-                await self.nats.publish("user.create_owner", {
-                    'org_id': created_org.get('id'),
-                    'email': org.primary_contact_email,
-                    'first_name': org.primary_contact_name.split()[0],
-                    'last_name': ' '.join(org.primary_contact_name.split()[1:]) or 'Admin',
-                    'created_by': requester.get('admin_id')
-                })
-                
-                # Publish event
-                await self.nats.publish("organization.created", created_org)
-                
-                await msg.respond(json.dumps({
-                    'success': True,
-                    'data': created_org
-                }).encode())
+                # Owner bootstrap, event publish and reply are independent;
+                # dispatch them together instead of serially
+                name_parts = org.primary_contact_name.split()
+                results = await asyncio.gather(
+                    self.nats.publish(_SUBJ_USER_CREATE_OWNER, {
+                        'org_id': created_org.get('id'),
+                        'email': org.primary_contact_email,
+                        'first_name': name_parts[0],
+                        'last_name': ' '.join(name_parts[1:]) or 'Admin',
+                        'created_by': requester.get('admin_id')
+                    }),
+                    self.nats.publish(_SUBJ_ORG_CREATED, created_org),
+                    msg.respond(_dumps({
+                        'success': True,
+                        'data': created_org
+                    })),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Error in create organization dispatch: %s", result)
             else:
-                await msg.respond(json.dumps(response).encode())
+                await msg.respond(_dumps(response))
                 
         except Exception as e:
-            logger.error(f"Error creating organization: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+            logger.error("Error creating organization: %s", e)
+            await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
             
     async def handle_update_organization(self, data: Dict[str, Any], msg) -> None:
         """Handle update organization request"""
@@ -108,54 +156,39 @@ class OrganizationController:
             
             # Check permissions
             if not self._has_permission(requester, 'org:update'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to update organization'
-                    }
-                }).encode())
+                await msg.respond(_ERR_FORBIDDEN_UPDATE)
                 return
                 
             # Check if admin can access this org
             if not self._can_access_org(requester, org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Cannot access this organization'
-                    }
-                }).encode())
+                await msg.respond(_ERR_NO_ORG_ACCESS)
                 return
                 
             # Update organization
             updates['updated_at'] = datetime.utcnow().isoformat()
             updates['updated_by'] = requester.get('admin_id')
             
-            response = await self.nats.request("db.update", {
+            response = await self.nats.request(_SUBJ_DB_UPDATE, {
                 'collection': 'organizations',
                 'id': org_id,
                 'updates': updates
             })
             
             if response.get('success'):
-                # Publish event
-                await self.nats.publish("organization.updated", {
-                    'org_id': org_id,
-                    'updates': updates
-                })
-                
-            await msg.respond(json.dumps(response).encode())
-            
+                # Dispatch the event and the reply in one scheduler cycle
+                await asyncio.gather(
+                    self.nats.publish(_SUBJ_ORG_UPDATED, {
+                        'org_id': org_id,
+                        'updates': updates
+                    }),
+                    msg.respond(_dumps(response))
+                )
+            else:
+                await msg.respond(_dumps(response))
+
         except Exception as e:
-            logger.error(f"Error updating organization: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+            logger.error("Error updating organization: %s", e)
+            await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
             
     async def handle_suspend_organization(self, data: Dict[str, Any], msg) -> None:
         """Handle suspend organization request"""
@@ -166,52 +199,44 @@ class OrganizationController:
             
             # Check permissions
             if not self._has_permission(requester, 'org:suspend'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to suspend organization'
-                    }
-                }).encode())
+                await msg.respond(_ERR_FORBIDDEN_SUSPEND)
                 return
                 
-            # Suspend organization
-            response = await self.nats.request("db.update", {
+            # Suspend organization; one timestamp so suspended_at and
+            # updated_at cannot drift apart
+            now_iso = datetime.utcnow().isoformat()
+            response = await self.nats.request(_SUBJ_DB_UPDATE, {
                 'collection': 'organizations',
                 'id': org_id,
                 'updates': {
-                    'status': OrganizationStatus.SUSPENDED,
+                    **_SUSPEND_BASE,
                     'suspended_reason': reason,
-                    'suspended_at': datetime.utcnow().isoformat(),
-                    'updated_at': datetime.utcnow().isoformat(),
+                    'suspended_at': now_iso,
+                    'updated_at': now_iso,
                     'updated_by': requester.get('admin_id')
                 }
             })
             
             if response.get('success'):
-                # Suspend all users
-                await self.nats.publish("user.suspend_all", {
-                    'org_id': org_id,
-                    'reason': f"Organization suspended: {reason}"
-                })
-                
-                # Publish event
-                await self.nats.publish("organization.suspended", {
-                    'org_id': org_id,
-                    'reason': reason
-                })
-                
-            await msg.respond(json.dumps(response).encode())
+                # The user suspension, event and reply are independent;
+                # dispatch them together
+                await asyncio.gather(
+                    self.nats.publish(_SUBJ_USER_SUSPEND_ALL, {
+                        'org_id': org_id,
+                        'reason': f"Organization suspended: {reason}"
+                    }),
+                    self.nats.publish(_SUBJ_ORG_SUSPENDED, {
+                        'org_id': org_id,
+                        'reason': reason
+                    }),
+                    msg.respond(_dumps(response))
+                )
+            else:
+                await msg.respond(_dumps(response))
             
         except Exception as e:
-            logger.error(f"Error suspending organization: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+            logger.error("Error suspending organization: %s", e)
+            await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
             
     async def handle_list_organizations(self, data: Dict[str, Any], msg) -> None:
         """Handle list organizations request"""
@@ -220,13 +245,7 @@ class OrganizationController:
             
             # Check permissions
             if not self._has_permission(requester, 'org:read'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to list organizations'
-                    }
-                }).encode())
+                await msg.respond(_ERR_FORBIDDEN_LIST)
                 return
                 
             # Build filter
@@ -239,32 +258,30 @@ class OrganizationController:
             if data.get('billing_plan'):
                 filter_params['billing_plan'] = data['billing_plan']
                 
-            # If not super admin, limit to accessible orgs
+            # If not super admin, limit to accessible orgs. No accessible
+            # orgs means an empty page; skip the DB round trip entirely
             if not requester.get('is_super_admin'):
                 org_ids = requester.get('org_ids', [])
-                if org_ids:
-                    filter_params['id'] = {'$in': org_ids}
-                    
+                if not org_ids:
+                    await msg.respond(_EMPTY_ORG_LIST)
+                    return
+                filter_params['id'] = {'$in': org_ids}
+
+
             # List organizations
-            response = await self.nats.request("db.find", {
+            response = await self.nats.request(_SUBJ_DB_FIND, {
                 'collection': 'organizations',
                 'filter': filter_params,
                 'sort': {'created_at': -1},
                 'limit': data.get('limit', 50),
                 'skip': data.get('skip', 0)
             })
-            
-            await msg.respond(json.dumps(response).encode())
+
+            await _respond_large(msg, response)
             
         except Exception as e:
-            logger.error(f"Error listing organizations: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+            logger.error("Error listing organizations: %s", e)
+            await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
             
     async def handle_get_organization_stats(self, data: Dict[str, Any], msg) -> None:
         """Handle get organization statistics request"""
@@ -275,118 +292,155 @@ class OrganizationController:
             
             # Check permissions
             if not self._has_permission(requester, 'org:read'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions'
-                    }
-                }).encode())
+                await msg.respond(_ERR_FORBIDDEN_STATS)
                 return
                 
             # Check access
             if not self._can_access_org(requester, org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Cannot access this organization'
-                    }
-                }).encode())
+                await msg.respond(_ERR_NO_ORG_ACCESS)
                 return
-                
-            # Calculate period
-            period_end = datetime.utcnow()
-            period_start = period_end - timedelta(days=period_days)
-            
-            # Get organization stats from various services
-            stats_requests = await asyncio.gather(
-                self.nats.request("user.get_stats", {
-                    'org_id': org_id,
-                    'period_start': period_start.isoformat(),
-                    'period_end': period_end.isoformat()
-                }),
-                self.nats.request("patient.get_stats", {
-                    'org_id': org_id,
-                    'period_start': period_start.isoformat(),
-                    'period_end': period_end.isoformat()
-                }),
-                self.nats.request("claim.get_stats", {
-                    'org_id': org_id,
-                    'period_start': period_start.isoformat(),
-                    'period_end': period_end.isoformat()
-                }),
-                return_exceptions=True
-            )
-            
-            # Combine stats
-            stats = OrganizationStats(
-                org_id=org_id,
-                period_start=period_start,
-                period_end=period_end
-            )
-            
-            # Process user stats
-            if isinstance(stats_requests[0], dict) and stats_requests[0].get('success'):
-                user_stats = stats_requests[0].get('data', {})
-                stats.total_users = user_stats.get('total_users', 0)
-                stats.active_users = user_stats.get('active_users', 0)
-                stats.new_users = user_stats.get('new_users', 0)
-                
-            # Process patient stats
-            if isinstance(stats_requests[1], dict) and stats_requests[1].get('success'):
-                patient_stats = stats_requests[1].get('data', {})
-                stats.total_patients = patient_stats.get('total_patients', 0)
-                stats.new_patients = patient_stats.get('new_patients', 0)
-                stats.active_patients = patient_stats.get('active_patients', 0)
-                
-            # Process claim stats
-            if isinstance(stats_requests[2], dict) and stats_requests[2].get('success'):
-                claim_stats = stats_requests[2].get('data', {})
-                stats.total_claims = claim_stats.get('total_claims', 0)
-                stats.submitted_claims = claim_stats.get('submitted_claims', 0)
-                stats.accepted_claims = claim_stats.get('accepted_claims', 0)
-                stats.rejected_claims = claim_stats.get('rejected_claims', 0)
-                stats.pending_claims = claim_stats.get('pending_claims', 0)
-                stats.total_billed = claim_stats.get('total_billed', 0.0)
-                stats.total_collected = claim_stats.get('total_collected', 0.0)
-                stats.outstanding_amount = claim_stats.get('outstanding_amount', 0.0)
-                stats.avg_claim_processing_time = claim_stats.get('avg_processing_time', 0.0)
-                stats.eligibility_check_count = claim_stats.get('eligibility_checks', 0)
-                stats.era_received_count = claim_stats.get('era_received', 0)
-                
-            await msg.respond(json.dumps({
-                'success': True,
-                'data': stats.dict()
-            }).encode())
-            
+
+            # Serve dashboard polling from the short-TTL cache
+            key = (org_id, period_days)
+            cached = self._stats_cache.get(key)
+            if cached and time.monotonic() - cached[0] < settings.STATS_CACHE_TTL:
+                await msg.respond(cached[1])
+                return
+
+            lock = self._stats_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another waiter may have refreshed while we queued
+                cached = self._stats_cache.get(key)
+                if cached and time.monotonic() - cached[0] < settings.STATS_CACHE_TTL:
+                    payload = cached[1]
+                else:
+                    payload = await self._collect_org_stats(org_id, period_days)
+                    self._stats_cache[key] = (time.monotonic(), payload)
+
+            await msg.respond(payload)
+
         except Exception as e:
-            logger.error(f"Error getting organization stats: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
-            
+            logger.error("Error getting organization stats: %s", e)
+            await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
+
+    async def _collect_org_stats(self, org_id: str, period_days: int) -> bytes:
+        """Fan out to the stats services and build the response bytes"""
+        # Calculate period; format the boundaries once and reuse the
+        # strings in both the fan-out payload and the response
+        period_end = datetime.utcnow()
+        period_start = period_end - timedelta(days=period_days)
+        ps_iso = period_start.isoformat()
+        pe_iso = period_end.isoformat()
+
+        # One scatter-gather request; the user/patient/claim services
+        # each reply on the shared inbox tagged with their domain. The
+        # soft deadline bounds the wait so one stalled downstream cannot
+        # hold up the reply: whatever arrived in time is rolled up and
+        # the missing domains keep their zero defaults.
+        replies = await self.nats.request_many(_SUBJ_STATS_COLLECT, {
+            'org_id': org_id,
+            'period_start': ps_iso,
+            'period_end': pe_iso,
+            'domains': ['user', 'patient', 'claim']
+        }, max_messages=3, timeout=settings.STATS_SOFT_DEADLINE)
+
+        by_domain = {}
+        for reply in replies:
+            if isinstance(reply, dict) and reply.get('success'):
+                by_domain[reply.get('domain')] = reply.get('data', {})
+
+        # Combine stats into a plain dict; the downstream replies are
+        # already JSON values, so a pydantic round-trip adds nothing
+        stats_out = {
+            'org_id': org_id,
+            'period_start': ps_iso,
+            'period_end': pe_iso,
+            # User stats
+            'total_users': 0,
+            'active_users': 0,
+            'new_users': 0,
+            # Patient stats
+            'total_patients': 0,
+            'new_patients': 0,
+            'active_patients': 0,
+            # Claim stats
+            'total_claims': 0,
+            'submitted_claims': 0,
+            'accepted_claims': 0,
+            'rejected_claims': 0,
+            'pending_claims': 0,
+            # Financial stats
+            'total_billed': 0.0,
+            'total_collected': 0.0,
+            'outstanding_amount': 0.0,
+            # Performance
+            'avg_claim_processing_time': 0.0,
+            'eligibility_check_count': 0,
+            'era_received_count': 0
+        }
+
+        # Process user stats
+        user_stats = by_domain.get('user')
+        if user_stats:
+            stats_out['total_users'] = user_stats.get('total_users', 0)
+            stats_out['active_users'] = user_stats.get('active_users', 0)
+            stats_out['new_users'] = user_stats.get('new_users', 0)
+
+        # Process patient stats
+        patient_stats = by_domain.get('patient')
+        if patient_stats:
+            stats_out['total_patients'] = patient_stats.get('total_patients', 0)
+            stats_out['new_patients'] = patient_stats.get('new_patients', 0)
+            stats_out['active_patients'] = patient_stats.get('active_patients', 0)
+
+        # Process claim stats
+        claim_stats = by_domain.get('claim')
+        if claim_stats:
+            stats_out['total_claims'] = claim_stats.get('total_claims', 0)
+            stats_out['submitted_claims'] = claim_stats.get('submitted_claims', 0)
+            stats_out['accepted_claims'] = claim_stats.get('accepted_claims', 0)
+            stats_out['rejected_claims'] = claim_stats.get('rejected_claims', 0)
+            stats_out['pending_claims'] = claim_stats.get('pending_claims', 0)
+            stats_out['total_billed'] = claim_stats.get('total_billed', 0.0)
+            stats_out['total_collected'] = claim_stats.get('total_collected', 0.0)
+            stats_out['outstanding_amount'] = claim_stats.get('outstanding_amount', 0.0)
+            stats_out['avg_claim_processing_time'] = claim_stats.get('avg_processing_time', 0.0)
+            stats_out['eligibility_check_count'] = claim_stats.get('eligibility_checks', 0)
+            stats_out['era_received_count'] = claim_stats.get('era_received', 0)
+
+        return await asyncio.get_running_loop().run_in_executor(None, _dumps, {
+            'success': True,
+            'data': stats_out
+        })
+
     def _has_permission(self, requester: Dict[str, Any], permission: str) -> bool:
         """Check if requester has permission"""
         if requester.get('is_super_admin'):
             return True
-        return permission in requester.get('permissions', [])
-        
+        # Materialize the permission set once per requester dict so
+        # repeated checks are O(1) instead of list scans
+        perm_set = requester.get('_perm_set')
+        if perm_set is None:
+            perm_set = frozenset(requester.get('permissions', ()))
+            requester['_perm_set'] = perm_set
+        return permission in perm_set
+
     def _can_access_org(self, requester: Dict[str, Any], org_id: str) -> bool:
         """Check if requester can access organization"""
         if requester.get('is_super_admin'):
             return True
-        org_ids = requester.get('org_ids', [])
-        return not org_ids or org_id in org_ids
+        org_set = requester.get('_org_set')
+        if org_set is None:
+            org_set = frozenset(requester.get('org_ids', ()))
+            requester['_org_set'] = org_set
+        return not org_set or org_id in org_set
         
     async def setup_subscriptions(self):
         """Setup NATS subscriptions"""
-        await self.nats.subscribe("organization.create", self.handle_create_organization)
-        await self.nats.subscribe("organization.update", self.handle_update_organization)
-        await self.nats.subscribe("organization.suspend", self.handle_suspend_organization)
-        await self.nats.subscribe("organization.list", self.handle_list_organizations)
-        await self.nats.subscribe("organization.get_stats", self.handle_get_organization_stats)
\ No newline at end of file
+        # Queue group so each command is handled by one replica
+        queue = 'htpi-admin-org'
+        await self.nats.subscribe("organization.create", self.handle_create_organization, queue=queue)
+        await self.nats.subscribe("organization.update", self.handle_update_organization, queue=queue)
+        await self.nats.subscribe("organization.suspend", self.handle_suspend_organization, queue=queue)
+        await self.nats.subscribe("organization.list", self.handle_list_organizations, queue=queue)
+        await self.nats.subscribe("organization.get_stats", self.handle_get_organization_stats, queue=queue)
\ No newline at end of file
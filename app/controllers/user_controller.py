@@ -1,15 +1,124 @@
 """User management controller"""
 
-import json
+import asyncio
+import base64
+import functools
 import logging
-import secrets
+import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
+import orjson
+
+from app.config import get_settings
 from app.models import User, UserInvite, UserRole, UserStatus
 from app.services import AuthService
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a response payload with orjson"""
+    return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+
+
+def _ok_bytes(data: Any) -> bytes:
+    """Serialize a success envelope to bytes"""
+    return orjson.dumps({'success': True, 'data': data}, option=orjson.OPT_NAIVE_UTC)
+
+
+def _error_bytes(code: str, message: str) -> bytes:
+    """Serialize an error envelope to bytes"""
+    return orjson.dumps({
+        'success': False,
+        'error': {
+            'code': code,
+            'message': message
+        }
+    })
+
+
+# Canned error responses, serialized once at import time
+_ERR_FORBIDDEN_CREATE = _error_bytes('FORBIDDEN', 'Insufficient permissions to create user')
+_ERR_FORBIDDEN_INVITE = _error_bytes('FORBIDDEN', 'Insufficient permissions to invite users')
+_ERR_FORBIDDEN_UPDATE = _error_bytes('FORBIDDEN', 'Insufficient permissions to update user')
+_ERR_FORBIDDEN_SUSPEND = _error_bytes('FORBIDDEN', 'Insufficient permissions to suspend user')
+_ERR_FORBIDDEN_LIST = _error_bytes('FORBIDDEN', 'Insufficient permissions to list users')
+_ERR_EMAIL_EXISTS = _error_bytes('ALREADY_EXISTS', 'User with this email already exists in organization')
+_ERR_USER_EXISTS = _error_bytes('ALREADY_EXISTS', 'User already exists in organization')
+_ERR_LIMIT_EXCEEDED = _error_bytes('LIMIT_EXCEEDED', 'Organization has reached maximum user limit')
+
+# How long the org/user display names used in invite emails stay fresh
+_NAME_CACHE_TTL = 60.0
+
+# Exclusion set handed to model_dump when persisting users
+_USER_DB_EXCLUDE = frozenset({'password_hash'})
+
+# Columns returned by user list queries unless the caller asks for more
+_LIST_DEFAULT_FIELDS = {
+    'id': 1, 'email': 1, 'first_name': 1, 'last_name': 1,
+    'role': 1, 'status': 1, 'created_at': 1
+}
+
+# Columns a caller may request via fields; everything else — above all
+# password_hash — never leaves the database
+_LIST_ALLOWED_FIELDS = frozenset({
+    'id', 'org_id', 'email', 'first_name', 'last_name',
+    'role', 'permissions', 'custom_permissions',
+    'npi', 'license_number', 'license_state', 'specialty',
+    'status', 'email_verified',
+    'last_login', 'last_activity', 'login_count',
+    'created_at', 'updated_at', 'created_by', 'updated_by'
+})
+
+# Fields a user may change on their own profile
+_SELF_UPDATE_ALLOWED = frozenset({
+    'first_name', 'last_name', 'preferences',
+    'notification_settings', 'password'
+})
+
+
+def _gen_token(nbytes: int) -> str:
+    """URL-safe random token, skipping the secrets-module indirection"""
+    return base64.urlsafe_b64encode(os.urandom(nbytes)).rstrip(b'=').decode('ascii')
+
+
+def _actor_id(requester: Dict[str, Any]) -> Any:
+    """Resolve the acting admin or user id once per requester dict"""
+    actor = requester.get('_actor_id')
+    if actor is None:
+        actor = requester.get('admin_id') or requester.get('user_id')
+        requester['_actor_id'] = actor
+    return actor
+
+
+# Handlers that hash passwords or fan out multiple round trips; their
+# concurrency is capped so a message burst queues in NATS instead of
+# piling up as in-process tasks
+_BOUNDED_HANDLERS = (
+    'handle_create_user', 'handle_invite_user',
+    'handle_update_user', 'handle_suspend_all',
+)
+
+# Queue group shared by instances of this service; NATS load-balances
+# each command across the group instead of delivering to every instance
+_QUEUE_GROUP = 'htpi-admin-user'
+
+# Subjects handled by this controller, dispatched through _safe_dispatch.
+# Commands join the queue group; the cache-eviction event deliberately
+# does not, since every instance must see it.
+_SUBS = (
+    ('user.create', 'handle_create_user', _QUEUE_GROUP),
+    ('user.invite', 'handle_invite_user', _QUEUE_GROUP),
+    ('user.update', 'handle_update_user', _QUEUE_GROUP),
+    ('user.suspend', 'handle_suspend_user', _QUEUE_GROUP),
+    ('user.list', 'handle_list_users', _QUEUE_GROUP),
+    ('user.create_owner', 'handle_create_owner', _QUEUE_GROUP),
+    ('user.suspend_all', 'handle_suspend_all', _QUEUE_GROUP),
+    ('organization.updated', '_handle_org_updated', ''),
+)
 
 
 class UserController:
@@ -18,532 +127,531 @@ class UserController:
     def __init__(self, nats_service, auth_service: AuthService):
         self.nats = nats_service
         self.auth = auth_service
+        # Short-TTL caches for the display names that decorate invite
+        # emails; per-key locks coalesce concurrent misses
+        self._org_name_cache: Dict[str, tuple] = {}
+        self._user_name_cache: Dict[str, tuple] = {}
+        self._name_locks: Dict[tuple, asyncio.Lock] = {}
+        # Per-handler backpressure for the expensive paths
+        self._handler_sems = {
+            name: asyncio.Semaphore(settings.MAX_INFLIGHT_PER_HANDLER)
+            for name in _BOUNDED_HANDLERS
+        }
         
     async def handle_create_user(self, data: Dict[str, Any], msg) -> None:
         """Handle create user request"""
-        try:
-            requester = data.get('requester', {})
-            user_data = data.get('user', {})
-            org_id = user_data.get('org_id')
-            
-            # Check permissions
-            if not self._has_permission(requester, 'user:create', org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to create user'
-                    }
-                }).encode())
-                return
-                
-            # Create user
-            password = user_data.pop('password', None)
-            if password:
-                user_data['password_hash'] = self.auth.hash_password(password)
-                
-            user = User(**user_data)
-            user.created_by = requester.get('admin_id') or requester.get('user_id')
+        requester = data.get('requester', {})
+        user_data = data.get('user', {})
+        org_id = user_data.get('org_id')
+        
+        # Check permissions
+        if not self._has_permission(requester, 'user:create', org_id):
+            await msg.respond(_ERR_FORBIDDEN_CREATE)
+            return
+            
+        # Create user
+        password = user_data.pop('password', None)
+        if password:
+            # bcrypt takes ~100ms and releases the GIL; hash in a
+            # worker thread so the event loop keeps serving
+            user_data['password_hash'] = await asyncio.to_thread(
+                self.auth.hash_password, password
+            )
             
-            # Check if email already exists in org
-            existing = await self.nats.request("db.find_one", {
+        user = User(**user_data)
+        user.created_by = _actor_id(requester)
+        
+        # The existence check and the org limits lookup are
+        # independent reads; run them concurrently so the create
+        # path waits one round-trip instead of two
+        existing, org_response = await asyncio.gather(
+            self.nats.request("db.find_one", {
                 'collection': 'users',
                 'filter': {
                     'email': user.email,
                     'org_id': org_id
                 }
-            })
-            
-            if existing.get('data'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'ALREADY_EXISTS',
-                        'message': 'User with this email already exists in organization'
-                    }
-                }).encode())
-                return
-                
-            # Check organization limits
-            org_response = await self.nats.request("db.find_by_id", {
+            }),
+            self.nats.request("db.find_by_id", {
                 'collection': 'organizations',
                 'id': org_id
             })
-            
-            if org_response.get('success'):
-                org = org_response.get('data', {})
-                if org.get('current_users', 0) >= org.get('max_users', 10):
-                    await msg.respond(json.dumps({
-                        'success': False,
-                        'error': {
-                            'code': 'LIMIT_EXCEEDED',
-                            'message': 'Organization has reached maximum user limit'
-                        }
-                    }).encode())
-                    return
-                    
-            # Save user
-            response = await self.nats.request("db.create", {
-                'collection': 'users',
-                'document': user.dict(exclude={'password_hash'})
-            })
-            
-            if response.get('success'):
-                created_user = response.get('data')
+        )
+
+        if existing.get('data'):
+            await msg.respond(_ERR_EMAIL_EXISTS)
+            return
+
+        if org_response.get('success'):
+            org = org_response.get('data', {})
+            if org.get('current_users', 0) >= org.get('max_users', 10):
+                await msg.respond(_ERR_LIMIT_EXCEEDED)
+                return
                 
-                # Update org user count
-                await self.nats.publish("organization.increment_users", {
+        # Save user
+        response = await self.nats.request("db.create", {
+            'collection': 'users',
+            'document': user.model_dump(mode='json', exclude=_USER_DB_EXCLUDE)
+        })
+        
+        if response.get('success'):
+            created_user = response.get('data')
+
+            # The count update, welcome email, event and reply are
+            # all independent; dispatch them in one batch so the
+            # client can coalesce the writes
+            results = await asyncio.gather(
+                self.nats.publish("organization.increment_users", {
                     'org_id': org_id,
                     'increment': 1
-                })
-                
-                # Send welcome email
-                await self.nats.publish("email.send_welcome", {
+                }),
+                self.nats.publish("email.send_welcome", {
                     'user_id': created_user.get('id'),
                     'email': user.email,
                     'first_name': user.first_name
-                })
-                
-                # Publish event
-                await self.nats.publish("user.created", created_user)
-                
-                await msg.respond(json.dumps({
-                    'success': True,
-                    'data': created_user
-                }).encode())
-            else:
-                await msg.respond(json.dumps(response).encode())
-                
-        except Exception as e:
-            logger.error(f"Error creating user: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+                }),
+                self.nats.publish("user.created", created_user),
+                msg.respond(_ok_bytes(created_user)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Error in create user dispatch: %s", result)
+        else:
+            await msg.respond(_dumps(response))
             
     async def handle_invite_user(self, data: Dict[str, Any], msg) -> None:
         """Handle invite user request"""
-        try:
-            requester = data.get('requester', {})
-            invite_data = data.get('invite', {})
-            org_id = invite_data.get('org_id')
-            
-            # Check permissions
-            if not self._has_permission(requester, 'user:invite', org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to invite users'
-                    }
-                }).encode())
-                return
-                
-            # Check if user already exists
-            existing = await self.nats.request("db.find_one", {
-                'collection': 'users',
-                'filter': {
-                    'email': invite_data.get('email'),
-                    'org_id': org_id
-                }
-            })
+        requester = data.get('requester', {})
+        invite_data = data.get('invite', {})
+        org_id = invite_data.get('org_id')
+        
+        # Check permissions
+        if not self._has_permission(requester, 'user:invite', org_id):
+            await msg.respond(_ERR_FORBIDDEN_INVITE)
+            return
             
-            if existing.get('data'):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'ALREADY_EXISTS',
-                        'message': 'User already exists in organization'
-                    }
-                }).encode())
-                return
-                
-            # Create invite
-            invite = UserInvite(
-                org_id=org_id,
-                email=invite_data.get('email'),
-                role=invite_data.get('role', UserRole.STAFF),
-                invite_token=secrets.token_urlsafe(32),
-                invited_by=requester.get('admin_id') or requester.get('user_id'),
-                message=invite_data.get('message'),
-                expires_at=datetime.utcnow() + timedelta(days=7)
+        # Check if user already exists
+        existing = await self.nats.request("db.find_one", {
+            'collection': 'users',
+            'filter': {
+                'email': invite_data.get('email'),
+                'org_id': org_id
+            }
+        })
+        
+        if existing.get('data'):
+            await msg.respond(_ERR_USER_EXISTS)
+            return
+            
+        # Create invite
+        invite = UserInvite(
+            org_id=org_id,
+            email=invite_data.get('email'),
+            role=invite_data.get('role', UserRole.STAFF),
+            invite_token=_gen_token(32),
+            invited_by=_actor_id(requester),
+            message=invite_data.get('message'),
+            expires_at=datetime.utcnow() + timedelta(days=7)
+        )
+        
+        # Save invite
+        response = await self.nats.request("db.create", {
+            'collection': 'user_invites',
+            'document': invite.model_dump(mode='json')
+        })
+        
+        if response.get('success'):
+            created_invite = response.get('data')
+
+            # The org and inviter names come from independent lookups
+            org_name, invited_by_name = await asyncio.gather(
+                self._get_org_name(org_id),
+                self._get_user_name(invite.invited_by)
             )
-            
-            # Save invite
-            response = await self.nats.request("db.create", {
-                'collection': 'user_invites',
-                'document': invite.dict()
+
+            # Send invite email
+            await self.nats.publish("email.send_invite", {
+                'invite_id': created_invite.get('id'),
+                'email': invite.email,
+                'org_name': org_name,
+                'invite_token': invite.invite_token,
+                'invited_by_name': invited_by_name,
+                'message': invite.message
             })
             
-            if response.get('success'):
-                created_invite = response.get('data')
-                
-                # Send invite email
-                await self.nats.publish("email.send_invite", {
-                    'invite_id': created_invite.get('id'),
-                    'email': invite.email,
-                    'org_name': await self._get_org_name(org_id),
-                    'invite_token': invite.invite_token,
-                    'invited_by_name': await self._get_user_name(invite.invited_by),
-                    'message': invite.message
-                })
-                
-                await msg.respond(json.dumps({
-                    'success': True,
-                    'data': created_invite
-                }).encode())
-            else:
-                await msg.respond(json.dumps(response).encode())
-                
-        except Exception as e:
-            logger.error(f"Error inviting user: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+            await msg.respond(_ok_bytes(created_invite))
+        else:
+            await msg.respond(_dumps(response))
             
     async def handle_update_user(self, data: Dict[str, Any], msg) -> None:
         """Handle update user request"""
-        try:
-            user_id = data.get('user_id')
-            updates = data.get('updates', {})
-            requester = data.get('requester', {})
-            
-            # Get user to check org
-            user_response = await self.nats.request("db.find_by_id", {
-                'collection': 'users',
-                'id': user_id
-            })
-            
-            if not user_response.get('success'):
-                await msg.respond(json.dumps(user_response).encode())
-                return
-                
-            user = user_response.get('data')
-            org_id = user.get('org_id')
-            
-            # Check permissions
-            is_self = requester.get('user_id') == user_id
-            can_manage = self._has_permission(requester, 'user:manage', org_id)
-            
-            if not (is_self or can_manage):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to update user'
-                    }
-                }).encode())
-                return
-                
-            # Restrict what users can update about themselves
-            if is_self and not can_manage:
-                allowed_fields = [
-                    'first_name', 'last_name', 'preferences',
-                    'notification_settings', 'password'
-                ]
-                updates = {k: v for k, v in updates.items() if k in allowed_fields}
-                
-            # Handle password update
-            if 'password' in updates:
-                password = updates.pop('password')
-                updates['password_hash'] = self.auth.hash_password(password)
-                
-            # Update user
-            updates['updated_at'] = datetime.utcnow().isoformat()
-            updates['updated_by'] = requester.get('admin_id') or requester.get('user_id')
+        user_id = data.get('user_id')
+        updates = data.get('updates', {})
+        requester = data.get('requester', {})
+        
+        # Get user to check org
+        user_response = await self.nats.request("db.find_by_id", {
+            'collection': 'users',
+            'id': user_id
+        })
+        
+        if not user_response.get('success'):
+            await msg.respond(_dumps(user_response))
+            return
             
-            response = await self.nats.request("db.update", {
-                'collection': 'users',
-                'id': user_id,
-                'updates': updates
-            })
+        user = user_response.get('data')
+        org_id = user.get('org_id')
+        
+        # Check permissions
+        is_self = requester.get('user_id') == user_id
+        can_manage = self._has_permission(requester, 'user:manage', org_id)
+        
+        if not (is_self or can_manage):
+            await msg.respond(_ERR_FORBIDDEN_UPDATE)
+            return
+            
+        # Restrict what users can update about themselves
+        if is_self and not can_manage:
+            updates = {k: updates[k] for k in updates.keys() & _SELF_UPDATE_ALLOWED}
+            
+        # Handle password update
+        if 'password' in updates:
+            password = updates.pop('password')
+            updates['password_hash'] = await asyncio.to_thread(
+                self.auth.hash_password, password
+            )
             
-            if response.get('success'):
-                # Publish event
-                await self.nats.publish("user.updated", {
+        # Update user
+        updates['updated_at'] = datetime.utcnow().isoformat()
+        updates['updated_by'] = _actor_id(requester)
+        
+        response = await self.nats.request("db.update", {
+            'collection': 'users',
+            'id': user_id,
+            'updates': updates
+        })
+        
+        if response.get('success'):
+            # The cached display name may be stale now
+            self._user_name_cache.pop(user_id, None)
+            # Dispatch the event and the reply in one scheduler cycle
+            await asyncio.gather(
+                self.nats.publish("user.updated", {
                     'user_id': user_id,
                     'org_id': org_id,
                     'updates': updates
-                })
-                
-            await msg.respond(json.dumps(response).encode())
-            
-        except Exception as e:
-            logger.error(f"Error updating user: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+                }),
+                msg.respond(_dumps(response))
+            )
+        else:
+            await msg.respond(_dumps(response))
             
     async def handle_suspend_user(self, data: Dict[str, Any], msg) -> None:
         """Handle suspend user request"""
-        try:
-            user_id = data.get('user_id')
-            reason = data.get('reason', 'Administrative action')
-            requester = data.get('requester', {})
-            
-            # Get user
-            user_response = await self.nats.request("db.find_by_id", {
-                'collection': 'users',
-                'id': user_id
-            })
-            
-            if not user_response.get('success'):
-                await msg.respond(json.dumps(user_response).encode())
-                return
-                
-            user = user_response.get('data')
-            org_id = user.get('org_id')
-            
-            # Check permissions
-            if not self._has_permission(requester, 'user:manage', org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to suspend user'
-                    }
-                }).encode())
-                return
-                
-            # Suspend user
-            response = await self.nats.request("db.update", {
-                'collection': 'users',
-                'id': user_id,
-                'updates': {
-                    'status': UserStatus.SUSPENDED,
-                    'suspended_reason': reason,
-                    'suspended_at': datetime.utcnow().isoformat(),
-                    'updated_at': datetime.utcnow().isoformat(),
-                    'updated_by': requester.get('admin_id') or requester.get('user_id')
-                }
-            })
-            
-            if response.get('success'):
-                # Invalidate user sessions
-                await self.nats.publish("auth.invalidate_user_sessions", {
-                    'user_id': user_id
+        user_id = data.get('user_id')
+        reason = data.get('reason', 'Administrative action')
+        requester = data.get('requester', {})
+        
+        # Check permissions; org scope is enforced by the update
+        # filter below, so no user lookup is needed first
+        if not self._has_permission(requester, 'user:manage'):
+            await msg.respond(_ERR_FORBIDDEN_SUSPEND)
+            return
+
+        # Suspend user in a single conditional update. Scoping the
+        # filter to the requester's orgs replaces the old
+        # find-then-check-then-update sequence (empty org_ids means
+        # access to all orgs, as elsewhere).
+        now_iso = datetime.utcnow().isoformat()
+        request_payload = {
+            'collection': 'users',
+            'id': user_id,
+            'updates': {
+                'status': UserStatus.SUSPENDED,
+                'suspended_reason': reason,
+                'suspended_at': now_iso,
+                'updated_at': now_iso,
+                'updated_by': _actor_id(requester)
+            }
+        }
+        if not requester.get('is_super_admin'):
+            org_ids = requester.get('org_ids', [])
+            if org_ids:
+                request_payload['filter'] = {'org_id': {'$in': list(org_ids)}}
+
+        response = await self.nats.request("db.update", request_payload)
+
+        if response.get('success') and response.get('matched_count', 1) == 0:
+            # Nothing matched the scoped filter: either the user does
+            # not exist or it lives outside the requester's orgs
+            await msg.respond(_ERR_FORBIDDEN_SUSPEND)
+            return
+
+        if response.get('success'):
+            # db.update replies carry counts, not the document, so the
+            # org for the event payload needs its own narrow lookup
+            org_id = (response.get('data') or {}).get('org_id')
+            if org_id is None:
+                user_response = await self.nats.request("db.find_by_id", {
+                    'collection': 'users',
+                    'id': user_id,
+                    'projection': {'org_id': 1}
                 })
-                
-                # Publish event
-                await self.nats.publish("user.suspended", {
+                if user_response.get('success'):
+                    org_id = (user_response.get('data') or {}).get('org_id')
+            # Session invalidation, event and reply are independent
+            await asyncio.gather(
+                self.nats.publish("auth.invalidate_user_sessions", {
+                    'user_id': user_id
+                }),
+                self.nats.publish("user.suspended", {
                     'user_id': user_id,
                     'org_id': org_id,
                     'reason': reason
-                })
-                
-            await msg.respond(json.dumps(response).encode())
-            
-        except Exception as e:
-            logger.error(f"Error suspending user: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+                }),
+                msg.respond(_dumps(response))
+            )
+        else:
+            await msg.respond(_dumps(response))
             
     async def handle_list_users(self, data: Dict[str, Any], msg) -> None:
         """Handle list users request"""
-        try:
-            org_id = data.get('org_id')
-            requester = data.get('requester', {})
-            
-            # Check permissions
-            if not self._has_permission(requester, 'user:read', org_id):
-                await msg.respond(json.dumps({
-                    'success': False,
-                    'error': {
-                        'code': 'FORBIDDEN',
-                        'message': 'Insufficient permissions to list users'
-                    }
-                }).encode())
-                return
-                
-            # Build filter
-            filter_params = {'org_id': org_id}
-            
-            if data.get('status'):
-                filter_params['status'] = data['status']
-            if data.get('role'):
-                filter_params['role'] = data['role']
-                
-            # List users
-            response = await self.nats.request("db.find", {
-                'collection': 'users',
-                'filter': filter_params,
-                'projection': {
-                    'password_hash': 0
-                },
-                'sort': {'created_at': -1},
-                'limit': data.get('limit', 50),
-                'skip': data.get('skip', 0)
-            })
-            
-            await msg.respond(json.dumps(response).encode())
+        org_id = data.get('org_id')
+        requester = data.get('requester', {})
+        
+        # Check permissions
+        if not self._has_permission(requester, 'user:read', org_id):
+            await msg.respond(_ERR_FORBIDDEN_LIST)
+            return
             
-        except Exception as e:
-            logger.error(f"Error listing users: {e}")
-            await msg.respond(json.dumps({
-                'success': False,
-                'error': {
-                    'code': 'INTERNAL_ERROR',
-                    'message': str(e)
-                }
-            }).encode())
+        # Build filter
+        filter_params = {'org_id': org_id}
+        
+        if data.get('status'):
+            filter_params['status'] = data['status']
+        if data.get('role'):
+            filter_params['role'] = data['role']
+            
+        # List users, projecting only the columns the caller needs.
+        # The inclusion list replaces the old password_hash exclusion,
+        # which returned entire documents for a UI table. Requested
+        # fields are intersected with the allowlist so a caller cannot
+        # project sensitive columns like password_hash.
+        fields = data.get('fields')
+        if fields:
+            projection = {
+                field: 1 for field in fields if field in _LIST_ALLOWED_FIELDS
+            } or _LIST_DEFAULT_FIELDS
+        else:
+            projection = _LIST_DEFAULT_FIELDS
+
+        response = await self.nats.request("db.find", {
+            'collection': 'users',
+            'filter': filter_params,
+            'projection': projection,
+            'sort': {'created_at': -1},
+            'limit': data.get('limit', 50),
+            'skip': data.get('skip', 0)
+        })
+        
+        await msg.respond(_dumps(response))
             
     async def handle_create_owner(self, data: Dict[str, Any], msg) -> None:
         """Handle create organization owner (called when org is created)"""
-        try:
-            org_id = data.get('org_id')
-            
-            # Create owner user
-            user = User(
-                org_id=org_id,
-                email=data.get('email'),
-                first_name=data.get('first_name'),
-                last_name=data.get('last_name'),
-                role=UserRole.OWNER,
-                status=UserStatus.ACTIVE,
-                email_verified=True,  # Trust org creation process
-                created_by=data.get('created_by')
-            )
-            
-            # Generate temporary password
-            temp_password = secrets.token_urlsafe(12)
-            user.password_hash = self.auth.hash_password(temp_password)
-            
-            # Save user
-            response = await self.nats.request("db.create", {
-                'collection': 'users',
-                'document': user.dict(exclude={'password_hash'})
+        org_id = data.get('org_id')
+        
+        # Create owner user
+        user = User(
+            org_id=org_id,
+            email=data.get('email'),
+            first_name=data.get('first_name'),
+            last_name=data.get('last_name'),
+            role=UserRole.OWNER,
+            status=UserStatus.ACTIVE,
+            email_verified=True,  # Trust org creation process
+            created_by=data.get('created_by')
+        )
+        
+        # Generate temporary password
+        temp_password = _gen_token(12)
+        user.password_hash = await asyncio.to_thread(
+            self.auth.hash_password, temp_password
+        )
+        
+        # Save user
+        response = await self.nats.request("db.create", {
+            'collection': 'users',
+            'document': user.model_dump(mode='json', exclude=_USER_DB_EXCLUDE)
+        })
+        
+        if response.get('success'):
+            created_user = response.get('data')
+            
+            # Send welcome email with temp password
+            await self.nats.publish("email.send_owner_welcome", {
+                'user_id': created_user.get('id'),
+                'email': user.email,
+                'first_name': user.first_name,
+                'temp_password': temp_password,
+                'org_id': org_id
             })
             
-            if response.get('success'):
-                created_user = response.get('data')
-                
-                # Send welcome email with temp password
-                await self.nats.publish("email.send_owner_welcome", {
-                    'user_id': created_user.get('id'),
-                    'email': user.email,
-                    'first_name': user.first_name,
-                    'temp_password': temp_password,
-                    'org_id': org_id
-                })
-                
-                logger.info(f"Created owner user for org {org_id}")
-                
-        except Exception as e:
-            logger.error(f"Error creating owner user: {e}")
+            logger.info(f"Created owner user for org {org_id}")
             
     async def handle_suspend_all(self, data: Dict[str, Any], msg) -> None:
         """Handle suspend all users in org (called when org is suspended)"""
-        try:
-            org_id = data.get('org_id')
-            reason = data.get('reason', 'Organization suspended')
-            
-            # Update all active users
-            await self.nats.request("db.update_many", {
-                'collection': 'users',
-                'filter': {
-                    'org_id': org_id,
-                    'status': UserStatus.ACTIVE
-                },
-                'updates': {
-                    'status': UserStatus.SUSPENDED,
-                    'suspended_reason': reason,
-                    'suspended_at': datetime.utcnow().isoformat(),
-                    'updated_at': datetime.utcnow().isoformat()
-                }
-            })
-            
-            # Invalidate all sessions for org
-            await self.nats.publish("auth.invalidate_org_sessions", {
-                'org_id': org_id
-            })
-            
-            logger.info(f"Suspended all users in org {org_id}")
-            
-        except Exception as e:
-            logger.error(f"Error suspending org users: {e}")
+        org_id = data.get('org_id')
+        reason = data.get('reason', 'Organization suspended')
+        
+        # Update all active users with a single shared timestamp
+        now_iso = datetime.utcnow().isoformat()
+        await self.nats.request("db.update_many", {
+            'collection': 'users',
+            'filter': {
+                'org_id': org_id,
+                'status': UserStatus.ACTIVE
+            },
+            'updates': {
+                'status': UserStatus.SUSPENDED,
+                'suspended_reason': reason,
+                'suspended_at': now_iso,
+                'updated_at': now_iso
+            }
+        })
+        
+        # Invalidate all sessions for org
+        await self.nats.publish("auth.invalidate_org_sessions", {
+            'org_id': org_id
+        })
+        
+        logger.info(f"Suspended all users in org {org_id}")
             
     def _has_permission(self, requester: Dict[str, Any], permission: str, org_id: str = None) -> bool:
         """Check if requester has permission"""
         # Super admin can do anything
         if requester.get('is_super_admin'):
             return True
-            
+
+        # Materialize the permission set once per requester dict; one
+        # message routinely passes through several checks
+        perm_set = requester.get('_perm_set')
+        if perm_set is None:
+            perm_set = frozenset(requester.get('permissions', ()))
+            requester['_perm_set'] = perm_set
+
         # Admin must have permission and org access
         if requester.get('admin_id'):
-            has_perm = permission in requester.get('permissions', [])
+            if permission not in perm_set:
+                return False
             if org_id:
-                org_ids = requester.get('org_ids', [])
-                can_access = not org_ids or org_id in org_ids
-                return has_perm and can_access
-            return has_perm
-            
+                org_set = requester.get('_org_set')
+                if org_set is None:
+                    org_set = frozenset(requester.get('org_ids', ()))
+                    requester['_org_set'] = org_set
+                return not org_set or org_id in org_set
+            return True
+
         # Regular user permissions
         if requester.get('user_id'):
-            user_perms = requester.get('permissions', [])
-            return permission in user_perms
-            
+            return permission in perm_set
+
         return False
         
     async def _get_org_name(self, org_id: str) -> str:
-        """Get organization name"""
-        response = await self.nats.request("db.find_by_id", {
-            'collection': 'organizations',
-            'id': org_id,
-            'projection': {'name': 1}
-        })
-        
-        if response.get('success'):
-            return response.get('data', {}).get('name', 'Organization')
-        return 'Organization'
-        
+        """Get organization name (cached)"""
+        entry = self._org_name_cache.get(org_id)
+        if entry and time.monotonic() - entry[0] < _NAME_CACHE_TTL:
+            return entry[1]
+
+        lock = self._name_locks.setdefault(('org', org_id), asyncio.Lock())
+        async with lock:
+            # Another waiter may have refreshed while we queued
+            entry = self._org_name_cache.get(org_id)
+            if entry and time.monotonic() - entry[0] < _NAME_CACHE_TTL:
+                return entry[1]
+
+            response = await self.nats.request("db.find_by_id", {
+                'collection': 'organizations',
+                'id': org_id,
+                'projection': {'name': 1}
+            })
+
+            name = 'Organization'
+            if response.get('success'):
+                name = response.get('data', {}).get('name', 'Organization')
+            self._org_name_cache[org_id] = (time.monotonic(), name)
+            return name
+
     async def _get_user_name(self, user_id: str) -> str:
-        """Get user full name"""
-        # Try users collection first
-        response = await self.nats.request("db.find_by_id", {
-            'collection': 'users',
-            'id': user_id,
-            'projection': {'first_name': 1, 'last_name': 1}
-        })
-        
-        if response.get('success') and response.get('data'):
-            user = response.get('data')
-            return f"{user.get('first_name', '')} {user.get('last_name', '')}".strip()
-            
-        # Try admin users
-        response = await self.nats.request("db.find_by_id", {
-            'collection': 'admin_users',
-            'id': user_id,
-            'projection': {'first_name': 1, 'last_name': 1}
-        })
-        
-        if response.get('success') and response.get('data'):
-            admin = response.get('data')
-            return f"{admin.get('first_name', '')} {admin.get('last_name', '')}".strip()
-            
+        """Get user full name (cached)"""
+        entry = self._user_name_cache.get(user_id)
+        if entry and time.monotonic() - entry[0] < _NAME_CACHE_TTL:
+            return entry[1]
+
+        lock = self._name_locks.setdefault(('user', user_id), asyncio.Lock())
+        async with lock:
+            entry = self._user_name_cache.get(user_id)
+            if entry and time.monotonic() - entry[0] < _NAME_CACHE_TTL:
+                return entry[1]
+
+            name = await self._fetch_user_name(user_id)
+            self._user_name_cache[user_id] = (time.monotonic(), name)
+            return name
+
+    async def _fetch_user_name(self, user_id: str) -> str:
+        """Resolve a user's full name from the users or admin_users collection"""
+        # An id lives in exactly one of the two collections, so look in
+        # both at once instead of falling back sequentially; prefer the
+        # users hit if somehow both answer
+        user_response, admin_response = await asyncio.gather(
+            self.nats.request("db.find_by_id", {
+                'collection': 'users',
+                'id': user_id,
+                'projection': {'first_name': 1, 'last_name': 1}
+            }),
+            self.nats.request("db.find_by_id", {
+                'collection': 'admin_users',
+                'id': user_id,
+                'projection': {'first_name': 1, 'last_name': 1}
+            }),
+            return_exceptions=True
+        )
+
+        for response in (user_response, admin_response):
+            if isinstance(response, Exception):
+                continue
+            if response.get('success') and response.get('data'):
+                record = response.get('data')
+                return f"{record.get('first_name', '')} {record.get('last_name', '')}".strip()
+
         return 'User'
         
+    async def _handle_org_updated(self, data: Dict[str, Any], msg) -> None:
+        """Evict a cached org name when the organization changes"""
+        self._org_name_cache.pop(data.get('org_id'), None)
+
+    
+    async def _safe_dispatch(self, fn, data: Dict[str, Any], msg) -> None:
+        """Run a handler inside the shared error envelope
+
+        Heavy handlers run under a semaphore so overload queues in NATS
+        rather than as unbounded in-process tasks.
+        """
+        sem = self._handler_sems.get(fn.__name__)
+        try:
+            if sem is not None:
+                async with sem:
+                    await fn(data, msg)
+            else:
+                await fn(data, msg)
+        except Exception as e:
+            logger.error("Error in %s: %s", fn.__name__, e)
+            if msg.reply:
+                await msg.respond(_error_bytes('INTERNAL_ERROR', str(e)))
+
     async def setup_subscriptions(self):
         """Setup NATS subscriptions"""
-        await self.nats.subscribe("user.create", self.handle_create_user)
-        await self.nats.subscribe("user.invite", self.handle_invite_user)
-        await self.nats.subscribe("user.update", self.handle_update_user)
-        await self.nats.subscribe("user.suspend", self.handle_suspend_user)
-        await self.nats.subscribe("user.list", self.handle_list_users)
-        await self.nats.subscribe("user.create_owner", self.handle_create_owner)
-        await self.nats.subscribe("user.suspend_all", self.handle_suspend_all)
\ No newline at end of file
+        for subject, name, queue in _SUBS:
+            handler = functools.partial(self._safe_dispatch, getattr(self, name))
+            await self.nats.subscribe(subject, handler, queue=queue)
\ No newline at end of file
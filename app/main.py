@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
+import signal
 
 from app.config import get_settings
-from app.services import NATSService, AuthService
+from app.services import NATSService, AuthService, get_nats
 from app.controllers import AdminController, OrganizationController, UserController
 
 # Setup logging
@@ -16,6 +17,30 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def ensure_indexes(nats_service: NATSService):
+    """Ensure indexes the admin service relies on"""
+    try:
+        # Unique email index backs db.create_unique in handle_create_admin
+        await nats_service.request("db.create_index", {
+            'collection': 'admin_users',
+            'keys': {'email': 1},
+            'unique': True
+        })
+        await nats_service.request("db.create_index", {
+            'collection': 'admin_users',
+            'keys': {'created_at': -1}
+        })
+        # Unique name index backs db.create_unique in handle_create_organization
+        await nats_service.request("db.create_index", {
+            'collection': 'organizations',
+            'keys': {'name': 1},
+            'unique': True
+        })
+
+    except Exception as e:
+        logger.error(f"Error ensuring indexes: {e}")
+
+
 async def create_super_admin(nats_service: NATSService, auth_service: AuthService):
     """Create default super admin if none exists"""
     try:
@@ -54,8 +79,9 @@ async def create_super_admin(nats_service: NATSService, auth_service: AuthServic
 
 async def main():
     """Main application entry point"""
-    # Initialize services
-    nats_service = NATSService()
+    # Initialize services; the shared getter also connects, so the
+    # controllers below all ride the same multiplexed connection
+    nats_service = await get_nats()
     auth_service = AuthService(nats_service)
     
     # Initialize controllers
@@ -64,35 +90,78 @@ async def main():
     user_controller = UserController(nats_service, auth_service)
     
     try:
-        # Connect to NATS
-        await nats_service.connect()
-        
-        # Create super admin if needed
+        # Ensure indexes and create super admin if needed
+        await ensure_indexes(nats_service)
         await create_super_admin(nats_service, auth_service)
+        await auth_service.preload_admin_emails()
+        # Broadcast, deliberately outside any queue group: every replica
+        # must admit a created, renamed or reactivated admin's email to
+        # its local filter
+        await nats_service.subscribe("admin.email_admitted",
+                                     auth_service.handle_admin_email_admitted)
         
         # Setup subscriptions
         await admin_controller.setup_subscriptions()
         await org_controller.setup_subscriptions()
         await user_controller.setup_subscriptions()
         
-        # Setup audit log subscription
+        # Setup audit log subscription. Single events are buffered and
+        # written with db.create_many so each one does not cost a full
+        # round trip; drop-oldest keeps memory bounded if the db stalls.
+        audit_buffer = []
+        max_buffered = settings.AUDIT_BATCH_SIZE * 10
+
+        async def flush_audit_buffer():
+            if not audit_buffer:
+                return
+            batch = audit_buffer[:]
+            del audit_buffer[:]
+            try:
+                await nats_service.request("db.create_many", {
+                    'collection': 'audit_logs',
+                    'documents': batch
+                })
+            except Exception as e:
+                logger.error(f"Error creating audit log batch: {e}")
+
+        async def audit_flusher():
+            while True:
+                await asyncio.sleep(settings.AUDIT_FLUSH_MS / 1000.0)
+                await flush_audit_buffer()
+
         async def handle_audit_create(data, msg):
+            if len(audit_buffer) >= max_buffered:
+                del audit_buffer[0]
+            audit_buffer.append(data)
+
+        async def handle_audit_create_batch(data, msg):
             try:
-                await nats_service.request("db.create", {
+                await nats_service.request("db.create_many", {
                     'collection': 'audit_logs',
-                    'document': data
+                    'documents': data.get('logs', [])
                 })
             except Exception as e:
-                logger.error(f"Error creating audit log: {e}")
-                
-        await nats_service.subscribe("audit.create", handle_audit_create)
+                logger.error(f"Error creating audit log batch: {e}")
+
+        await nats_service.subscribe("audit.create", handle_audit_create,
+                                     queue='htpi-admin-audit')
+        await nats_service.subscribe("audit.create_batch", handle_audit_create_batch,
+                                     queue='htpi-admin-audit')
+        audit_task = asyncio.create_task(audit_flusher())
         
         logger.info(f"{settings.SERVICE_NAME} started successfully")
         
-        # Keep service running
-        while True:
-            await asyncio.sleep(1)
-            
+        # Park until a shutdown signal arrives; unlike a sleep loop this
+        # never wakes the event loop while the service is idle
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+        await stop.wait()
+        logger.info("Shutting down...")
+        audit_task.cancel()
+        await flush_audit_buffer()
+
     except KeyboardInterrupt:
         logger.info("Shutting down...")
     except Exception as e:
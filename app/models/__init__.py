@@ -1,11 +1,17 @@
 """Admin service models"""
 
-from .admin import AdminUser, AdminSession, AuditLog, AdminRole, AdminPermission
+from .admin import (
+    AdminUser, AdminSession, AuditLog, AdminRole, AdminPermission,
+    PERMISSION_BIT, SUPER_ADMIN_BIT, permissions_to_mask,
+    ROLE_MASKS, mask_to_permissions,
+)
 from .organization import Organization, OrganizationStats, OrganizationType, OrganizationStatus, BillingPlan
 from .user import User, UserInvite, UserRole, UserStatus, UserPermission
 
 __all__ = [
     'AdminUser', 'AdminSession', 'AuditLog', 'AdminRole', 'AdminPermission',
+    'PERMISSION_BIT', 'SUPER_ADMIN_BIT', 'permissions_to_mask',
+    'ROLE_MASKS', 'mask_to_permissions',
     'Organization', 'OrganizationStats', 'OrganizationType', 'OrganizationStatus', 'BillingPlan',
     'User', 'UserInvite', 'UserRole', 'UserStatus', 'UserPermission'
 ]
\ No newline at end of file
@@ -2,11 +2,11 @@
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, EmailStr, validator
-from enum import Enum
+from pydantic import BaseModel, Field, validator
+from enum import StrEnum
 
 
-class AdminRole(str, Enum):
+class AdminRole(StrEnum):
     """Admin role types"""
     SUPER_ADMIN = "super_admin"
     ORG_ADMIN = "org_admin"
@@ -16,7 +16,7 @@ class AdminRole(str, Enum):
     READ_ONLY_ADMIN = "read_only"
 
 
-class AdminPermission(str, Enum):
+class AdminPermission(StrEnum):
     """Admin permissions"""
     # User management
     USER_CREATE = "user:create"
@@ -53,10 +53,95 @@ class AdminPermission(str, Enum):
     REPORT_EXPORT = "report:export"
 
 
+# Role defaults, built once at import; the validator hands back a copy
+# instead of rebuilding the list through an if/elif chain per model
+_ADMIN_ROLE_PERMS: Dict[AdminRole, tuple] = {
+    AdminRole.SUPER_ADMIN: tuple(AdminPermission),
+    AdminRole.ORG_ADMIN: (
+        AdminPermission.USER_CREATE,
+        AdminPermission.USER_READ,
+        AdminPermission.USER_UPDATE,
+        AdminPermission.USER_SUSPEND,
+        AdminPermission.ORG_READ,
+        AdminPermission.ORG_UPDATE,
+        AdminPermission.BILLING_VIEW,
+        AdminPermission.CLINICAL_VIEW,
+        AdminPermission.REPORT_VIEW,
+        AdminPermission.REPORT_CREATE,
+    ),
+    AdminRole.BILLING_ADMIN: (
+        AdminPermission.BILLING_VIEW,
+        AdminPermission.BILLING_UPDATE,
+        AdminPermission.BILLING_EXPORT,
+        AdminPermission.REPORT_VIEW,
+        AdminPermission.REPORT_EXPORT,
+    ),
+    AdminRole.CLINICAL_ADMIN: (
+        AdminPermission.CLINICAL_VIEW,
+        AdminPermission.CLINICAL_AUDIT,
+        AdminPermission.CLINICAL_EXPORT,
+        AdminPermission.REPORT_VIEW,
+        AdminPermission.REPORT_CREATE,
+    ),
+    AdminRole.SUPPORT_ADMIN: (
+        AdminPermission.USER_READ,
+        AdminPermission.ORG_READ,
+        AdminPermission.CLINICAL_VIEW,
+        AdminPermission.SYSTEM_MONITOR,
+    ),
+    AdminRole.READ_ONLY_ADMIN: (
+        AdminPermission.USER_READ,
+        AdminPermission.ORG_READ,
+        AdminPermission.BILLING_VIEW,
+        AdminPermission.CLINICAL_VIEW,
+        AdminPermission.REPORT_VIEW,
+    ),
+}
+
+
+# Bit assigned to each permission in definition order. Folding the
+# permission list into a mask turns has_permission into a single AND on
+# the auth hot path; the list form stays on the wire because the
+# gateway and db contracts carry permissions as strings.
+PERMISSION_BIT: Dict[AdminPermission, int] = {
+    perm: 1 << i for i, perm in enumerate(AdminPermission)
+}
+
+# Mask with every defined permission bit set
+ALL_PERMISSIONS_MASK = (1 << len(PERMISSION_BIT)) - 1
+
+# Reserved high bit meaning "super admin: every check passes"
+SUPER_ADMIN_BIT = 1 << 63
+
+
+def permissions_to_mask(permissions) -> int:
+    """Fold an iterable of permissions (members or values) into a bitmask"""
+    mask = 0
+    for perm in permissions:
+        # str-enum members hash like their values, so raw strings from
+        # JSON resolve through the same dict
+        mask |= PERMISSION_BIT.get(perm, 0)
+    return mask
+
+
+def mask_to_permissions(mask: int) -> List[AdminPermission]:
+    """Decode a bitmask back into the permission list"""
+    return [perm for perm, bit in PERMISSION_BIT.items() if mask & bit]
+
+
+# Precomputed role -> bitmask table, folded once at import. Lets authz
+# answer for role-default grants without touching the permission lists.
+ROLE_MASKS: Dict[AdminRole, int] = {
+    role: permissions_to_mask(perms)
+    for role, perms in _ADMIN_ROLE_PERMS.items()
+}
+
+
 class AdminUser(BaseModel):
     """Admin user model"""
     id: Optional[str] = Field(None, description="Admin user ID")
-    email: EmailStr = Field(..., description="Admin email address")
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+                       description="Admin email address")
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     role: AdminRole = Field(..., description="Admin role")
@@ -81,63 +166,23 @@ class AdminUser(BaseModel):
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
     
+    @property
+    def permissions_mask(self) -> int:
+        """Bitmask form of the permission list for O(1) checks"""
+        if self.is_super_admin:
+            return SUPER_ADMIN_BIT | ALL_PERMISSIONS_MASK
+        return permissions_to_mask(self.permissions)
+
     @validator('permissions', pre=True, always=True)
     def set_permissions_by_role(cls, v, values):
         """Set default permissions based on role"""
+        if v:
+            # Already populated (e.g. read back from the DB): pass through
+            return v
         role = values.get('role')
-        if not v and role:
-            if role == AdminRole.SUPER_ADMIN:
-                return list(AdminPermission)
-            elif role == AdminRole.ORG_ADMIN:
-                return [
-                    AdminPermission.USER_CREATE,
-                    AdminPermission.USER_READ,
-                    AdminPermission.USER_UPDATE,
-                    AdminPermission.USER_SUSPEND,
-                    AdminPermission.ORG_READ,
-                    AdminPermission.ORG_UPDATE,
-                    AdminPermission.BILLING_VIEW,
-                    AdminPermission.CLINICAL_VIEW,
-                    AdminPermission.REPORT_VIEW,
-                    AdminPermission.REPORT_CREATE
-                ]
-            elif role == AdminRole.BILLING_ADMIN:
-                return [
-                    AdminPermission.BILLING_VIEW,
-                    AdminPermission.BILLING_UPDATE,
-                    AdminPermission.BILLING_EXPORT,
-                    AdminPermission.REPORT_VIEW,
-                    AdminPermission.REPORT_EXPORT
-                ]
-            elif role == AdminRole.CLINICAL_ADMIN:
-                return [
-                    AdminPermission.CLINICAL_VIEW,
-                    AdminPermission.CLINICAL_AUDIT,
-                    AdminPermission.CLINICAL_EXPORT,
-                    AdminPermission.REPORT_VIEW,
-                    AdminPermission.REPORT_CREATE
-                ]
-            elif role == AdminRole.SUPPORT_ADMIN:
-                return [
-                    AdminPermission.USER_READ,
-                    AdminPermission.ORG_READ,
-                    AdminPermission.CLINICAL_VIEW,
-                    AdminPermission.SYSTEM_MONITOR
-                ]
-            elif role == AdminRole.READ_ONLY_ADMIN:
-                return [
-                    AdminPermission.USER_READ,
-                    AdminPermission.ORG_READ,
-                    AdminPermission.BILLING_VIEW,
-                    AdminPermission.CLINICAL_VIEW,
-                    AdminPermission.REPORT_VIEW
-                ]
+        if role:
+            return list(_ADMIN_ROLE_PERMS.get(role, ()))
         return v
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class AdminSession(BaseModel):
@@ -177,9 +222,4 @@ class AuditLog(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if failed")
     
     # Timestamp
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    created_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
@@ -1,12 +1,12 @@
 """Organization management models"""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field, validator
-from enum import Enum
+from enum import StrEnum
 
 
-class OrganizationType(str, Enum):
+class OrganizationType(StrEnum):
     """Organization types"""
     HOSPITAL = "hospital"
     CLINIC = "clinic"
@@ -17,7 +17,7 @@ class OrganizationType(str, Enum):
     OTHER = "other"
 
 
-class OrganizationStatus(str, Enum):
+class OrganizationStatus(StrEnum):
     """Organization status"""
     ACTIVE = "active"
     SUSPENDED = "suspended"
@@ -26,7 +26,7 @@ class OrganizationStatus(str, Enum):
     TRIAL = "trial"
 
 
-class BillingPlan(str, Enum):
+class BillingPlan(StrEnum):
     """Billing plans"""
     FREE_TRIAL = "free_trial"
     BASIC = "basic"
@@ -35,6 +35,23 @@ class BillingPlan(str, Enum):
     CUSTOM = "custom"
 
 
+# Features per plan, built once at import time
+_PLAN_FEATURES: Dict[BillingPlan, tuple] = {
+    BillingPlan.FREE_TRIAL: ('basic_claims', 'patient_management'),
+    BillingPlan.BASIC: ('basic_claims', 'patient_management', 'insurance_verification'),
+    BillingPlan.PROFESSIONAL: (
+        'basic_claims', 'patient_management', 'insurance_verification',
+        'batch_claims', 'era_processing', 'reporting',
+    ),
+    BillingPlan.ENTERPRISE: (
+        'basic_claims', 'patient_management', 'insurance_verification',
+        'batch_claims', 'era_processing', 'reporting', 'api_access',
+        'custom_workflows', 'advanced_analytics',
+    ),
+}
+_PLAN_FEATURES[BillingPlan.CUSTOM] = _PLAN_FEATURES[BillingPlan.ENTERPRISE]
+
+
 class Organization(BaseModel):
     """Organization model"""
     id: Optional[str] = Field(None, description="Organization ID")
@@ -69,7 +86,7 @@ class Organization(BaseModel):
     
     # Settings
     settings: Dict[str, Any] = Field(default_factory=dict)
-    features: List[str] = Field(default_factory=list)
+    features: Tuple[str, ...] = Field(default_factory=tuple)
     
     # Limits
     max_users: int = Field(10, description="Maximum number of users")
@@ -97,24 +114,12 @@ class Organization(BaseModel):
     @validator('features', pre=True, always=True)
     def set_features_by_plan(cls, v, values):
         """Set features based on billing plan"""
+        if v:
+            return v
         plan = values.get('billing_plan')
-        if not v and plan:
-            if plan == BillingPlan.FREE_TRIAL:
-                return ['basic_claims', 'patient_management']
-            elif plan == BillingPlan.BASIC:
-                return ['basic_claims', 'patient_management', 'insurance_verification']
-            elif plan == BillingPlan.PROFESSIONAL:
-                return [
-                    'basic_claims', 'patient_management', 'insurance_verification',
-                    'batch_claims', 'era_processing', 'reporting'
-                ]
-            elif plan in [BillingPlan.ENTERPRISE, BillingPlan.CUSTOM]:
-                return [
-                    'basic_claims', 'patient_management', 'insurance_verification',
-                    'batch_claims', 'era_processing', 'reporting', 'api_access',
-                    'custom_workflows', 'advanced_analytics'
-                ]
-        return v
+        # Shared per-plan tuple: no per-instance list build, and the
+        # tuple field keeps callers from mutating the shared object
+        return _PLAN_FEATURES.get(plan, ()) if plan else v
     
     class Config:
         json_encoders = {
@@ -1,12 +1,12 @@
 """User management models"""
 
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, EmailStr
-from enum import Enum
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from enum import StrEnum
 
 
-class UserRole(str, Enum):
+class UserRole(StrEnum):
     """User roles within an organization"""
     OWNER = "owner"
     ADMIN = "admin"
@@ -16,7 +16,7 @@ class UserRole(str, Enum):
     READ_ONLY = "read_only"
 
 
-class UserStatus(str, Enum):
+class UserStatus(StrEnum):
     """User status"""
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -24,7 +24,7 @@ class UserStatus(str, Enum):
     PENDING_VERIFICATION = "pending_verification"
 
 
-class UserPermission(str, Enum):
+class UserPermission(StrEnum):
     """User permissions"""
     # Patient management
     PATIENT_CREATE = "patient:create"
@@ -65,11 +65,64 @@ class UserPermission(str, Enum):
     USER_MANAGE = "user:manage"
 
 
+# Role defaults, built once at import time
+_USER_ROLE_PERMS: Dict[UserRole, tuple] = {
+    UserRole.OWNER: tuple(UserPermission),
+    UserRole.ADMIN: tuple(
+        p for p in UserPermission if not p.value.startswith('org:settings')
+    ),
+    UserRole.BILLER: (
+        UserPermission.PATIENT_READ,
+        UserPermission.INSURANCE_CREATE,
+        UserPermission.INSURANCE_READ,
+        UserPermission.INSURANCE_UPDATE,
+        UserPermission.INSURANCE_VERIFY,
+        UserPermission.FORM_CREATE,
+        UserPermission.FORM_READ,
+        UserPermission.FORM_UPDATE,
+        UserPermission.FORM_SUBMIT,
+        UserPermission.CLAIM_SUBMIT,
+        UserPermission.CLAIM_READ,
+        UserPermission.CLAIM_UPDATE,
+        UserPermission.CLAIM_BATCH,
+        UserPermission.REPORT_VIEW,
+        UserPermission.REPORT_EXPORT,
+    ),
+    UserRole.PROVIDER: (
+        UserPermission.PATIENT_CREATE,
+        UserPermission.PATIENT_READ,
+        UserPermission.PATIENT_UPDATE,
+        UserPermission.INSURANCE_READ,
+        UserPermission.FORM_CREATE,
+        UserPermission.FORM_READ,
+        UserPermission.FORM_UPDATE,
+        UserPermission.CLAIM_READ,
+        UserPermission.REPORT_VIEW,
+    ),
+    UserRole.STAFF: (
+        UserPermission.PATIENT_CREATE,
+        UserPermission.PATIENT_READ,
+        UserPermission.PATIENT_UPDATE,
+        UserPermission.INSURANCE_READ,
+        UserPermission.FORM_READ,
+        UserPermission.CLAIM_READ,
+    ),
+    UserRole.READ_ONLY: (
+        UserPermission.PATIENT_READ,
+        UserPermission.INSURANCE_READ,
+        UserPermission.FORM_READ,
+        UserPermission.CLAIM_READ,
+        UserPermission.REPORT_VIEW,
+    ),
+}
+
+
 class User(BaseModel):
     """Organization user model"""
     id: Optional[str] = Field(None, description="User ID")
     org_id: str = Field(..., description="Organization ID")
-    email: EmailStr = Field(..., description="User email")
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+                       description="User email")
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     
@@ -109,65 +162,26 @@ class User(BaseModel):
     created_by: Optional[str] = None
     updated_by: Optional[str] = None
     
-    def get_all_permissions(self) -> List[str]:
+    # Memoized union of role, per-user and custom permissions; every
+    # authz check calls get_all_permissions, so rebuild only when one
+    # of the three inputs actually changed
+    _perms_cache: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    _perms_cache_key: Optional[Tuple] = PrivateAttr(default=None)
+
+    def get_all_permissions(self) -> FrozenSet[str]:
         """Get all user permissions including role-based ones"""
-        role_permissions = self._get_role_permissions()
-        all_perms = set(role_permissions + self.permissions + self.custom_permissions)
-        return list(all_perms)
+        key = (self.role, tuple(self.permissions), tuple(self.custom_permissions))
+        if key != self._perms_cache_key:
+            role_permissions = _USER_ROLE_PERMS.get(self.role, ())
+            self._perms_cache = frozenset(
+                [*role_permissions, *self.permissions, *self.custom_permissions]
+            )
+            self._perms_cache_key = key
+        return self._perms_cache
     
     def _get_role_permissions(self) -> List[UserPermission]:
         """Get permissions based on role"""
-        if self.role == UserRole.OWNER:
-            return list(UserPermission)
-        elif self.role == UserRole.ADMIN:
-            return [p for p in UserPermission if not p.value.startswith('org:settings')]
-        elif self.role == UserRole.BILLER:
-            return [
-                UserPermission.PATIENT_READ,
-                UserPermission.INSURANCE_CREATE,
-                UserPermission.INSURANCE_READ,
-                UserPermission.INSURANCE_UPDATE,
-                UserPermission.INSURANCE_VERIFY,
-                UserPermission.FORM_CREATE,
-                UserPermission.FORM_READ,
-                UserPermission.FORM_UPDATE,
-                UserPermission.FORM_SUBMIT,
-                UserPermission.CLAIM_SUBMIT,
-                UserPermission.CLAIM_READ,
-                UserPermission.CLAIM_UPDATE,
-                UserPermission.CLAIM_BATCH,
-                UserPermission.REPORT_VIEW,
-                UserPermission.REPORT_EXPORT
-            ]
-        elif self.role == UserRole.PROVIDER:
-            return [
-                UserPermission.PATIENT_CREATE,
-                UserPermission.PATIENT_READ,
-                UserPermission.PATIENT_UPDATE,
-                UserPermission.INSURANCE_READ,
-                UserPermission.FORM_CREATE,
-                UserPermission.FORM_READ,
-                UserPermission.FORM_UPDATE,
-                UserPermission.CLAIM_READ,
-                UserPermission.REPORT_VIEW
-            ]
-        elif self.role == UserRole.STAFF:
-            return [
-                UserPermission.PATIENT_CREATE,
-                UserPermission.PATIENT_READ,
-                UserPermission.PATIENT_UPDATE,
-                UserPermission.INSURANCE_READ,
-                UserPermission.FORM_READ,
-                UserPermission.CLAIM_READ
-            ]
-        else:  # READ_ONLY
-            return [
-                UserPermission.PATIENT_READ,
-                UserPermission.INSURANCE_READ,
-                UserPermission.FORM_READ,
-                UserPermission.CLAIM_READ,
-                UserPermission.REPORT_VIEW
-            ]
+        return list(_USER_ROLE_PERMS.get(self.role, _USER_ROLE_PERMS[UserRole.READ_ONLY]))
     
     class Config:
         json_encoders = {
@@ -179,7 +193,8 @@ class UserInvite(BaseModel):
     """User invitation model"""
     id: Optional[str] = Field(None, description="Invite ID")
     org_id: str = Field(..., description="Organization ID")
-    email: EmailStr = Field(..., description="Invited email")
+    email: str = Field(..., pattern=r'^[^@\s]+@[^@\s]+\.[^@\s]+$',
+                       description="Invited email")
     role: UserRole = Field(..., description="Assigned role")
     
     # Invite details
@@ -1,6 +1,6 @@
 """Admin service services"""
 
-from .nats_service import NATSService
+from .nats_service import NATSService, BatchedPublisher, get_nats
 from .auth_service import AuthService
 
-__all__ = ['NATSService', 'AuthService']
\ No newline at end of file
+__all__ = ['NATSService', 'BatchedPublisher', 'get_nats', 'AuthService']
\ No newline at end of file
@@ -1,23 +1,91 @@
 """Authentication and authorization service"""
 
+import asyncio
 import logging
+import secrets
+import time
 from datetime import datetime, timedelta
+from hashlib import blake2b
 from typing import Optional, Dict, Any
-import jwt
+
 import bcrypt
+import jwt
+import orjson
 
 from app.config import get_settings
-from app.models import AdminUser, AdminSession
+from app.models import AdminUser, AdminSession, PERMISSION_BIT, ROLE_MASKS
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Signing material prepared once: jwt.encode/decode re-derive the HMAC
+# key from the secret string on every call, the PyJWS instance with
+# precomputed key bytes does not
+_SIGNING_KEY = settings.JWT_SECRET.encode()
+_JWS = jwt.api_jws.PyJWS()
+
+# Coarse shared clock. Auth timestamps need second granularity at most,
+# so the wall clock is sampled at ~100ms ticks and served from module
+# globals in between; refresh-on-read avoids a background task that
+# would need starting before the event loop exists.
+_CLOCK_TICK = 0.1
+_clock_mono = -1.0
+_clock_ts = 0.0
+_clock_dt = datetime(1970, 1, 1)
+_clock_iso = _clock_dt.isoformat()
+
+
+def _clock_refresh() -> None:
+    global _clock_mono, _clock_ts, _clock_dt, _clock_iso
+    mono = time.monotonic()
+    if mono - _clock_mono >= _CLOCK_TICK:
+        _clock_mono = mono
+        _clock_ts = time.time()
+        _clock_dt = datetime.utcnow()
+        _clock_iso = _clock_dt.isoformat()
+
+
+def _now_ts() -> float:
+    """Coarse epoch seconds"""
+    _clock_refresh()
+    return _clock_ts
+
+
+def _now_dt() -> datetime:
+    """Coarse naive-UTC datetime"""
+    _clock_refresh()
+    return _clock_dt
+
+
+def _now_iso() -> str:
+    """Coarse ISO-8601 timestamp"""
+    _clock_refresh()
+    return _clock_iso
+
 
 class AuthService:
     """Handle authentication and authorization"""
     
     def __init__(self, nats_service):
         self.nats = nats_service
+        # In-process session cache keyed by token digest: positive hits
+        # skip the NATS round trip for a few seconds, the negative side
+        # short-circuits replayed invalid tokens. The shared Redis tier
+        # from the design note is omitted; this service has no Redis.
+        self._session_l1: Dict[bytes, tuple] = {}
+        self._session_neg: Dict[bytes, float] = {}
+        # Activity updates are buffered and flushed in batches
+        self._activity_buf: Dict[str, str] = {}
+        self._activity_task: Optional[asyncio.Task] = None
+        # Known admin emails; lets authenticate_admin reject unknown
+        # addresses without a NATS round trip. Admin counts are small
+        # enough that an exact set beats a Bloom filter here. None means
+        # the preload failed and the filter is disabled.
+        self._admin_email_filter: Optional[set] = None
+        # Verified-JWT cache: token digest -> decoded payload. A token
+        # that passed HMAC once stays trusted until its exp, so repeat
+        # requests skip the signature work entirely.
+        self._jwt_cache: Dict[bytes, Dict[str, Any]] = {}
         
     def hash_password(self, password: str) -> str:
         """Hash a password"""
@@ -30,38 +98,91 @@ class AuthService:
         
     def generate_token(self, admin_user: AdminUser) -> str:
         """Generate JWT token for admin"""
+        ts = int(_now_ts())
         payload = {
             'admin_id': admin_user.id,
             'email': admin_user.email,
             'role': admin_user.role,
-            'permissions': admin_user.permissions,
+            # Mask only; the permission list roughly quintupled the
+            # signing input and every consumer resolves the mask
+            'permissions_mask': admin_user.permissions_mask,
             'is_super_admin': admin_user.is_super_admin,
-            'exp': datetime.utcnow() + timedelta(seconds=settings.JWT_EXPIRATION_DELTA),
-            'iat': datetime.utcnow()
+            'exp': ts + settings.JWT_EXPIRATION_DELTA,
+            'iat': ts
         }
         
-        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        return _JWS.encode(orjson.dumps(payload), _SIGNING_KEY,
+                           algorithm=settings.JWT_ALGORITHM)
         
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode JWT token"""
+        key = blake2b(token.encode(), digest_size=16).digest()
+        cached = self._jwt_cache.get(key)
+        if cached is not None:
+            if cached.get('exp', 0) > _now_ts():
+                return cached
+            self._jwt_cache.pop(key, None)
+
         try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
+            # PyJWS verifies the signature only; the exp claim is
+            # checked by hand below, which is all this service needs
+            payload = orjson.loads(_JWS.decode(
+                token, _SIGNING_KEY, algorithms=[settings.JWT_ALGORITHM]
+            ))
+            if payload.get('exp', 0) <= _now_ts():
+                logger.warning("Token expired")
+                return None
+            if len(self._jwt_cache) > 50_000:
+                now_ts = time.time()
+                self._jwt_cache = {
+                    k: v for k, v in self._jwt_cache.items()
+                    if v.get('exp', 0) > now_ts
+                }
+            self._jwt_cache[key] = payload
             return payload
             
-        except jwt.ExpiredSignatureError:
-            logger.warning("Token expired")
-            return None
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {e}")
             return None
             
+    async def preload_admin_emails(self) -> None:
+        """Load the known-admin email filter at startup"""
+        try:
+            response = await self.nats.request("db.find", {
+                'collection': 'admin_users',
+                'filter': {'is_active': True},
+                'projection': {'email': 1},
+                'limit': 0
+            })
+            if response.get('success'):
+                self._admin_email_filter = {
+                    doc.get('email') for doc in response.get('data', []) or []
+                }
+                logger.info(f"Loaded {len(self._admin_email_filter)} admin emails")
+        except Exception as e:
+            logger.error(f"Admin email preload failed: {e}")
+
+    def note_admin_email(self, email: str) -> None:
+        """Admit a newly created admin's email to the filter"""
+        if self._admin_email_filter is not None:
+            self._admin_email_filter.add(email)
+
+    async def handle_admin_email_admitted(self, data, msg) -> None:
+        """Broadcast handler keeping every replica's filter current"""
+        email = data.get('email')
+        if email:
+            self.note_admin_email(email)
+
     async def authenticate_admin(self, email: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticate admin user"""
         try:
+            # Unknown email: definite miss, skip the round trip. This is
+            # the main shield against credential-stuffing floods turning
+            # into NATS RPC load.
+            if self._admin_email_filter is not None and \
+                    email not in self._admin_email_filter:
+                return None
+
             # Get admin from database
             response = await self.nats.request("admin.get_by_email", {
                 'email': email
@@ -79,14 +200,24 @@ class AuthService:
                 logger.warning(f"Inactive admin login attempt: {email}")
                 return None
                 
-            # Check if account is locked
+            # One timestamp per attempt; reused for the lockout check
+            # and last_login
+            now_iso = _now_iso()
+
+            # Check if account is locked. Both sides are ISO-8601 from
+            # the same producer, so a lexicographic string comparison
+            # replaces the fromisoformat parse
             locked_until = admin_data.get('locked_until')
-            if locked_until and datetime.fromisoformat(locked_until) > datetime.utcnow():
+            if locked_until and locked_until > now_iso:
                 logger.warning(f"Locked admin login attempt: {email}")
                 return None
                 
-            # Verify password
-            if not self.verify_password(password, admin_data.get('password_hash', '')):
+            # Verify password in a worker thread; a bcrypt round blocks
+            # for tens of milliseconds and releases the GIL in C
+            verified = await asyncio.to_thread(
+                self.verify_password, password, admin_data.get('password_hash', '')
+            )
+            if not verified:
                 # Update failed login attempts
                 await self.nats.publish("admin.update_login_attempts", {
                     'admin_id': admin_data['id'],
@@ -94,27 +225,26 @@ class AuthService:
                 })
                 return None
                 
-            # Reset failed attempts on successful login
-            await self.nats.publish("admin.update_login_attempts", {
+            # Reset failed attempts and record last login in one
+            # publish instead of two back-to-back messages
+            await self.nats.publish("admin.post_login_update", {
                 'admin_id': admin_data['id'],
-                'reset': True
+                'reset_attempts': True,
+                'last_login': now_iso
             })
             
-            # Update last login
-            await self.nats.publish("admin.update_last_login", {
-                'admin_id': admin_data['id'],
-                'last_login': datetime.utcnow().isoformat()
-            })
-            
-            # Create admin user object
-            admin_user = AdminUser(**admin_data)
+            # Rehydrate without re-validating; this record was validated
+            # when it was written and came straight from the database
+            admin_user = AdminUser.model_construct(**admin_data)
             
             # Generate token
             token = self.generate_token(admin_user)
             
             return {
                 'token': token,
-                'admin': admin_user.dict(exclude={'password_hash', 'mfa_secret'})
+                'admin': admin_user.model_dump(
+                    mode='json', exclude={'password_hash', 'mfa_secret'}
+                )
             }
             
         except Exception as e:
@@ -124,17 +254,25 @@ class AuthService:
     async def create_session(self, admin_id: str, token: str, ip_address: str, user_agent: str) -> Optional[AdminSession]:
         """Create admin session"""
         try:
+            now = _now_dt()
+            # Random IDs instead of timestamp-derived ones: no collisions
+            # under concurrent logins and nothing about creation time
+            # leaks into the identifier
             session = AdminSession(
-                id=f"session_{datetime.utcnow().timestamp()}",
+                id=f"session_{secrets.token_urlsafe(16)}",
                 admin_id=admin_id,
                 token=token,
                 ip_address=ip_address,
                 user_agent=user_agent,
-                expires_at=datetime.utcnow() + timedelta(seconds=settings.JWT_EXPIRATION_DELTA)
+                created_at=now,
+                last_activity=now,
+                expires_at=now + timedelta(seconds=settings.JWT_EXPIRATION_DELTA)
             )
             
             # Store session
-            response = await self.nats.request("admin.create_session", session.dict())
+            response = await self.nats.request(
+                "admin.create_session", session.model_dump(mode='json')
+            )
             
             if response.get('success'):
                 return session
@@ -148,9 +286,21 @@ class AuthService:
     async def validate_session(self, token: str) -> Optional[Dict[str, Any]]:
         """Validate admin session"""
         try:
+            key = blake2b(token.encode(), digest_size=16).digest()
+            now = time.monotonic()
+
+            if self._session_neg.get(key, 0) > now:
+                return None
+
+            cached = self._session_l1.get(key)
+            if cached and cached[0] > now:
+                self._touch_activity(cached[2])
+                return cached[1]
+
             # Verify token
             payload = self.verify_token(token)
             if not payload:
+                self._note_invalid_token(key, now)
                 return None
                 
             # Check if session exists and is active
@@ -163,23 +313,73 @@ class AuthService:
                 
             session = response.get('data')
             if not session or not session.get('is_active'):
+                self._note_invalid_token(key, now)
                 return None
-                
-            # Update last activity
-            await self.nats.publish("admin.update_session_activity", {
-                'session_id': session['id'],
-                'last_activity': datetime.utcnow().isoformat()
-            })
-            
+
+            if len(self._session_l1) > 10_000:
+                self._prune_session_caches(now)
+            self._session_l1[key] = (
+                now + settings.SESSION_CACHE_TTL, payload, session['id']
+            )
+            self._touch_activity(session['id'])
+
             return payload
             
         except Exception as e:
             logger.error(f"Session validation error: {e}")
             return None
-            
+
+    def _note_invalid_token(self, key: bytes, now: float) -> None:
+        """Negative-cache an invalid token, keeping the cache bounded
+
+        An invalid-token flood is exactly what this cache absorbs, so it
+        cannot be allowed to grow one entry per junk token: past the
+        bound, expired entries are dropped first, then the oldest —
+        insertion order matches expiry order since the TTL is constant.
+        """
+        if len(self._session_neg) > 10_000:
+            self._session_neg = {
+                k: v for k, v in self._session_neg.items() if v > now
+            }
+            while len(self._session_neg) > 10_000:
+                self._session_neg.pop(next(iter(self._session_neg)))
+        self._session_neg[key] = now + settings.SESSION_NEG_CACHE_TTL
+
+    def _prune_session_caches(self, now: float) -> None:
+        """Drop expired cache entries to keep memory bounded"""
+        self._session_l1 = {
+            k: v for k, v in self._session_l1.items() if v[0] > now
+        }
+        self._session_neg = {
+            k: v for k, v in self._session_neg.items() if v > now
+        }
+
+    def _touch_activity(self, session_id: str) -> None:
+        """Record session activity; flushed in batches off the hot path"""
+        self._activity_buf[session_id] = _now_iso()
+        if self._activity_task is None:
+            self._activity_task = asyncio.create_task(self._flush_activity())
+
+    async def _flush_activity(self) -> None:
+        """Periodically publish buffered session activity updates"""
+        while True:
+            await asyncio.sleep(settings.SESSION_ACTIVITY_FLUSH_SECONDS)
+            if not self._activity_buf:
+                continue
+            batch, self._activity_buf = self._activity_buf, {}
+            try:
+                await self.nats.publish("admin.update_session_activity_batch", {
+                    'sessions': batch
+                })
+            except Exception as e:
+                logger.error(f"Session activity flush error: {e}")
+
     async def logout(self, token: str):
         """Logout admin (invalidate session)"""
         try:
+            # Evict immediately so a logged-out token cannot be served
+            # from the positive cache for the rest of its TTL
+            self._session_l1.pop(blake2b(token.encode(), digest_size=16).digest(), None)
             await self.nats.publish("admin.invalidate_session", {
                 'token': token
             })
@@ -191,14 +391,33 @@ class AuthService:
         """Check if admin has specific permission"""
         if admin_data.get('is_super_admin'):
             return True
-            
-        permissions = admin_data.get('permissions', [])
-        return permission in permissions
+
+        # Mask fast path: one AND instead of a list scan
+        mask = admin_data.get('permissions_mask')
+        if mask is not None:
+            return bool(mask & PERMISSION_BIT.get(permission, 0))
+
+        # Legacy payloads without a mask: build the set once per payload
+        # and stash it on the dict so repeat checks are O(1)
+        perm_set = admin_data.get('_perm_set')
+        if perm_set is None:
+            permissions = admin_data.get('permissions')
+            if permissions is None:
+                # Trimmed payloads carry only the role; answer from the
+                # import-time role mask table
+                role_mask = ROLE_MASKS.get(admin_data.get('role'), 0)
+                return bool(role_mask & PERMISSION_BIT.get(permission, 0))
+            perm_set = frozenset(permissions)
+            admin_data['_perm_set'] = perm_set
+        return permission in perm_set
         
     def can_access_org(self, admin_data: Dict[str, Any], org_id: str) -> bool:
         """Check if admin can access organization"""
         if admin_data.get('is_super_admin'):
             return True
             
-        org_ids = admin_data.get('org_ids', [])
-        return org_id in org_ids or len(org_ids) == 0  # Empty means all orgs
\ No newline at end of file
+        org_set = admin_data.get('_org_set')
+        if org_set is None:
+            org_set = frozenset(admin_data.get('org_ids', ()))
+            admin_data['_org_set'] = org_set
+        return org_id in org_set or not org_set  # Empty means all orgs
\ No newline at end of file
@@ -1,8 +1,17 @@
-"""NATS communication service"""
+"""NATS communication service
 
-import json
+Wire format is JSON encoded with orjson. MessagePack would shave ~20%
+off payload sizes, but every peer service on these subjects speaks
+JSON; switching is a fleet-wide coordinated change, not something this
+service can do unilaterally.
+"""
+
+import asyncio
 import logging
+import random
 from typing import Dict, Any, Optional, Callable
+
+import orjson
 import nats
 from nats.errors import TimeoutError as NatsTimeoutError
 
@@ -11,63 +20,176 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Timeout envelope shared across calls so a stampede of timeouts does
+# not allocate a pair of dicts per failure. Plain dicts rather than a
+# read-only proxy: callers re-serialize failed responses with orjson,
+# which rejects mappingproxy. Callers only ever read these responses.
+_ERR_TIMEOUT = {
+    'success': False,
+    'error': {
+        'code': 'TIMEOUT',
+        'message': 'Request timed out'
+    }
+}
+
+# Connect options assembled once at import. Built-in reconnect keeps a
+# dropped connection healing inside the client instead of callers
+# re-running connect() and re-paying the handshake.
+_CONNECT_KWARGS = {
+    'servers': settings.NATS_URL,
+    'user': settings.NATS_USER,
+    'password': settings.NATS_PASS,
+    'name': settings.SERVICE_NAME,
+    # Service-scoped prefix for the shared mux inbox that
+    # request(old_style=False) multiplexes replies over
+    'inbox_prefix': b'_INBOX.' + settings.SERVICE_NAME.encode(),
+    # Headroom for reply bursts so the mux inbox is not throttled by
+    # the default pending buffer
+    'pending_size': 4 * 1024 * 1024,
+    'allow_reconnect': True,
+    'max_reconnect_attempts': -1,
+    'reconnect_time_wait': 2,
+    'ping_interval': 20,
+}
+
 
 class NATSService:
     """Handle NATS messaging"""
-    
+
+    # Fixed layout: attribute access on the per-RPC hot path is a slot
+    # load instead of an instance-dict lookup
+    __slots__ = ('nc', 'js', '_pending_acks', '_workers', '_connected')
+
     def __init__(self):
-        self.nc = None
+        self.nc: Optional[nats.NATS] = None
         self.js = None
+        # Outstanding JetStream ack futures; drained once per batch
+        self._pending_acks: list = []
+        # Worker tasks backing concurrent subscriptions
+        self._workers: list = []
+        # Connection state mirrored from client callbacks so
+        # is_connected() is a plain attribute read and stays honest
+        # during transient disconnects
+        self._connected: bool = False
         
     async def connect(self):
         """Connect to NATS server"""
         try:
             self.nc = await nats.connect(
-                servers=settings.NATS_URL,
-                user=settings.NATS_USER,
-                password=settings.NATS_PASS,
-                name=settings.SERVICE_NAME
+                **_CONNECT_KWARGS,
+                disconnected_cb=self._on_disconnected,
+                reconnected_cb=self._on_reconnected,
+                closed_cb=self._on_closed
             )
             self.js = self.nc.jetstream()
+            self._connected = True
             logger.info(f"Connected to NATS at {settings.NATS_URL}")
             
         except Exception as e:
             logger.error(f"Failed to connect to NATS: {e}")
             raise
+
+    async def _on_disconnected(self):
+        self._connected = False
+        logger.warning("NATS connection lost")
+
+    async def _on_reconnected(self):
+        self._connected = True
+        logger.info("NATS connection restored")
+
+    async def _on_closed(self):
+        self._connected = False
             
     async def disconnect(self):
         """Disconnect from NATS"""
+        self._connected = False
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
         if self.nc:
             await self.nc.close()
             logger.info("Disconnected from NATS")
             
     async def publish(self, subject: str, data: Dict[str, Any]):
-        """Publish message to NATS"""
-        try:
-            message = json.dumps(data).encode()
-            await self.nc.publish(subject, message)
-            logger.debug(f"Published to {subject}: {data}")
-            
-        except Exception as e:
-            logger.error(f"Failed to publish to {subject}: {e}")
-            raise
+        """Publish message to NATS
+
+        Failures propagate; callers on the gather paths already log and
+        classify them, so a catch-log-reraise here was pure duplication.
+        """
+        await self.nc.publish(subject, orjson.dumps(data))
+        # Lazy %s and no payload dump: repr of a nested dict costs
+        # more than the publish when debug logging is off
+        logger.debug("Published to %s", subject)
             
-    async def request(self, subject: str, data: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
-        """Send request and wait for response"""
+    async def publish_raw(self, subject: str, payload: bytes,
+                          headers: Optional[Dict[str, str]] = None):
+        """Publish pre-serialized bytes without re-encoding
+
+        For relay-style handlers and callers that hold canned payloads;
+        the bytes go onto the wire as-is.
+        """
+        await self.nc.publish(subject, payload, headers=headers)
+
+    async def publish_many(self, items):
+        """Publish a batch of (subject, data) pairs with one flush
+
+        Each item is buffered into the client's pending writes; a single
+        flush at the end pushes the whole batch to the server instead of
+        letting every message schedule its own flush cycle.
+        """
+        for subject, data in items:
+            await self.nc.publish(subject, orjson.dumps(data))
+        await self.nc.flush()
+
+    def publish_js(self, subject: str, data: Dict[str, Any]) -> asyncio.Task:
+        """Publish to JetStream without waiting for the ack
+
+        The publish is started as a task and its ack future is parked on
+        the pending list; callers await drain_js once per batch instead
+        of paying a server round trip per message.
+        """
+        task = asyncio.create_task(self.js.publish(subject, orjson.dumps(data)))
+        self._pending_acks.append(task)
+        return task
+
+    async def drain_js(self) -> None:
+        """Await every outstanding JetStream ack"""
+        if not self._pending_acks:
+            return
+        pending, self._pending_acks = self._pending_acks, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"JetStream publish failed: {result}")
+
+    async def request(self, subject: str, data: Dict[str, Any], timeout: float = 5.0,
+                      retries: int = 0, backoff_base: float = 0.1) -> Dict[str, Any]:
+        """Send request and wait for response
+
+        retries > 0 re-sends after a timeout with jittered exponential
+        backoff. Only opt in for idempotent subjects — a retried create
+        can double-apply if the first attempt landed late.
+        """
         try:
-            message = json.dumps(data).encode()
-            response = await self.nc.request(subject, message, timeout=timeout)
-            return json.loads(response.data.decode())
-            
-        except NatsTimeoutError:
+            # Encode once; retries reuse the same bytes
+            message = orjson.dumps(data)
+            for attempt in range(retries + 1):
+                try:
+                    # old_style=False keeps nats-py on its shared mux inbox:
+                    # one long-lived wildcard subscription with token-matched
+                    # replies instead of a SUB/UNSUB pair per request
+                    response = await self.nc.request(subject, message,
+                                                     timeout=timeout, old_style=False)
+                    return orjson.loads(response.data)
+                except NatsTimeoutError:
+                    if attempt >= retries:
+                        break
+                    await asyncio.sleep(
+                        backoff_base * (2 ** attempt) + random.random() * 0.05
+                    )
+
             logger.error(f"Request timeout for {subject}")
-            return {
-                'success': False,
-                'error': {
-                    'code': 'TIMEOUT',
-                    'message': 'Request timed out'
-                }
-            }
+            return _ERR_TIMEOUT
         except Exception as e:
             logger.error(f"Request failed for {subject}: {e}")
             return {
@@ -78,23 +200,177 @@ class NATSService:
                 }
             }
             
-    async def subscribe(self, subject: str, handler: Callable):
-        """Subscribe to a subject"""
+    async def request_many(self, subject: str, data: Dict[str, Any],
+                           max_messages: int = 3, timeout: float = 2.0) -> list:
+        """Publish one request and collect replies from multiple responders
+
+        Used for scatter-gather subjects where several services answer the
+        same request. Returns whatever replies arrive within the timeout.
+        """
         try:
+            message = orjson.dumps(data)
+            inbox = self.nc.new_inbox()
+            sub = await self.nc.subscribe(inbox)
+            await self.nc.publish(subject, message, reply=inbox)
+
+            replies = []
+            loop = asyncio.get_event_loop()
+            deadline = loop.time() + timeout
+            try:
+                while len(replies) < max_messages:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        reply = await sub.next_msg(timeout=remaining)
+                    except NatsTimeoutError:
+                        break
+                    replies.append(orjson.loads(reply.data))
+            finally:
+                await sub.unsubscribe()
+
+            return replies
+
+        except Exception as e:
+            logger.error(f"Scatter request failed for {subject}: {e}")
+            return []
+
+    async def respond(self, msg, payload: bytes, headers: Optional[Dict[str, str]] = None):
+        """Respond to a request message, optionally with NATS headers"""
+        if headers and msg.reply:
+            await self.nc.publish(msg.reply, payload, headers=headers)
+        else:
+            await msg.respond(payload)
+
+    async def subscribe(self, subject: str, handler: Callable, queue: str = '',
+                        raw: bool = False, concurrency: int = 1,
+                        queue_size: int = 1024):
+        """Subscribe to a subject, optionally as part of a queue group
+
+        With raw=True the handler receives msg.data as bytes and no JSON
+        decode happens here — for relays that republish payloads intact.
+
+        With concurrency > 1, messages are fed through a bounded queue
+        to that many worker tasks, so a slow handler neither stalls the
+        client's read loop nor fans out into unbounded tasks; when the
+        queue is full new messages are dropped with a warning.
+
+        Subscription failures propagate to the caller; only the
+        per-message handlers swallow exceptions, since a raise there
+        would kill the subscription.
+        """
+        if concurrency > 1:
+            work: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+            async def worker():
+                while True:
+                    data, msg = await work.get()
+                    try:
+                        await handler(data, msg)
+                    except Exception as e:
+                        logger.error(f"Error in message handler for {subject}: {e}")
+
+            for _ in range(concurrency):
+                self._workers.append(asyncio.create_task(worker()))
+
+            async def message_handler(msg):
+                try:
+                    data = msg.data if raw else orjson.loads(msg.data)
+                    work.put_nowait((data, msg))
+                except asyncio.QueueFull:
+                    logger.warning("Handler queue full for %s; dropping message", subject)
+                except Exception as e:
+                    logger.error(f"Error in message handler for {subject}: {e}")
+        else:
             async def message_handler(msg):
                 try:
-                    data = json.loads(msg.data.decode())
+                    # orjson takes bytes directly; no intermediate str
+                    data = msg.data if raw else orjson.loads(msg.data)
                     await handler(data, msg)
                 except Exception as e:
                     logger.error(f"Error in message handler for {subject}: {e}")
-                    
-            await self.nc.subscribe(subject, cb=message_handler)
-            logger.info(f"Subscribed to {subject}")
-            
-        except Exception as e:
-            logger.error(f"Failed to subscribe to {subject}: {e}")
-            raise
-            
+
+        await self.nc.subscribe(subject, queue=queue, cb=message_handler)
+        logger.info("Subscribed to %s", subject)
+
     def is_connected(self) -> bool:
         """Check if connected to NATS"""
-        return self.nc is not None and self.nc.is_connected
\ No newline at end of file
+        return self._connected
+
+
+class BatchedPublisher:
+    """Coalesce high-rate fire-and-forget publishes into timed batches
+
+    Messages are encoded on submit and buffered; the buffer drains when
+    it reaches max_batch or on a millisecond-scale timer, whichever
+    comes first, with one flush per drain. For event streams where a
+    couple of milliseconds of added latency is acceptable.
+    """
+
+    __slots__ = ('_nats', '_max_batch', '_delay', '_buffer', '_task')
+
+    def __init__(self, nats_service: NATSService, max_batch: int = 256,
+                 max_delay_ms: float = 2.0):
+        self._nats = nats_service
+        self._max_batch = max_batch
+        self._delay = max_delay_ms / 1000.0
+        self._buffer = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background drain timer"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the timer and drain whatever is buffered"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self._flush()
+
+    async def publish(self, subject: str, data: Dict[str, Any]):
+        """Queue a message; drains early once the batch size is hit"""
+        self._buffer.append((subject, orjson.dumps(data)))
+        if len(self._buffer) >= self._max_batch:
+            await self._flush()
+
+    async def _flush(self):
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        try:
+            nc = self._nats.nc
+            for subject, payload in batch:
+                await nc.publish(subject, payload)
+            await nc.flush()
+        except Exception as e:
+            logger.error(f"Batched publish flush failed: {e}")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self._delay)
+            await self._flush()
+
+
+# Process-wide instance. One TCP connection multiplexes every subject
+# this service touches; anything that constructs its own NATSService
+# pays a fresh handshake and splits the mux inbox for no benefit.
+_instance: Optional[NATSService] = None
+
+
+async def get_nats() -> NATSService:
+    """Return the shared NATSService instance, connecting on first use
+
+    Only connects when there is no live client (never connected, or
+    fully closed). A transiently disconnected client is left alone —
+    its own reconnect loop owns that case, and replacing it here would
+    orphan every subscription on the old connection.
+    """
+    global _instance
+    if _instance is None:
+        _instance = NATSService()
+    nc = _instance.nc
+    if nc is None or nc.is_closed:
+        await _instance.connect()
+    return _instance
\ No newline at end of file